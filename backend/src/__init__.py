@@ -0,0 +1,21 @@
+"""Agent UI backend package.
+
+Importing any ``src`` module loads ``backend/.env`` first, so configuration
+modules can read environment variables at import time.
+"""
+
+import functools
+from pathlib import Path
+
+import dotenv
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+@functools.cache
+def load_env() -> None:
+    """Load ``backend/.env`` once per process; existing variables take precedence."""
+    dotenv.load_dotenv(dotenv_path=BACKEND_DIR / ".env", override=False)
+
+
+load_env()
@@ -11,28 +11,35 @@ Example:
 Configuration:
     - Model: qwen-plus (cost-effective for simple conversations)
     - Streaming: Enabled
-    - Event storage: Enabled
+    - Event storage: Enabled, minus STORE_EVENT_MASK events (token deltas)
 """
 
 from agno.agent.agent import Agent
 from agno.models.openai import OpenAIChat
-from ...config.model_config import qwen_model_config
+from agno.run.agent import RunEvent
+from ...config.base import llm_cache_enabled, store_event_mask
+from ...config.http import shared_http_client
+from ...config.model_config import QWEN_ROLE_MAP, qwen_model_config
 
 # Initialize model
 model = OpenAIChat(
     id=qwen_model_config.model_name,
     api_key=qwen_model_config.api_key,
     base_url=qwen_model_config.base_url,
+    # One connection pool for both agents (same DashScope host)
+    http_client=shared_http_client,
+    # The response cache only serves deterministic models
+    temperature=0 if llm_cache_enabled else None,
 )
 
 # Fix role mapping for Qwen API
-model.default_role_map = {
-    "system": "system",
-    "user": "user",
-    "assistant": "assistant",
-    "tool": "tool",
-    "model": "assistant",
-}
+model.default_role_map = QWEN_ROLE_MAP
+
+# Opt-in: serve repeated requests from the shared response cache
+if llm_cache_enabled:
+    from ...cache import cache_model_responses
+
+    cache_model_responses(model)
 
 # Create agent instance
 chat_agent = Agent(
@@ -42,5 +49,5 @@ chat_agent = Agent(
     markdown=True,
     stream_events=True,
     store_events=True,
-    events_to_skip=[],
+    events_to_skip=[RunEvent(name) for name in store_event_mask],
 )
@@ -16,44 +16,134 @@ Tools Used:
 Configuration:
     - Model: qwen-max (better instruction following)
     - Streaming: Enabled
-    - Event storage: Enabled
+    - Event storage: Enabled, minus STORE_EVENT_MASK events (token deltas)
     - HITL: Enabled (interactive clarification)
+    - Prompt caching: System prompt marked for DashScope explicit cache
+    - Parallel tool calls: Enabled when TOOL_CONCURRENCY_LIMIT > 1
 """
 
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
 from agno.agent.agent import Agent
+from agno.models.message import Message
 from agno.models.openai import OpenAIChat
+from agno.run.agent import RunEvent
+from agno.run.base import RunContext
 from agno.utils.log import agent_logger
 
-from ...config.model_config import qwen_max_config
+from ...config.base import (
+    llm_cache_enabled,
+    store_event_mask,
+    tool_concurrency_limit,
+)
+from ...config.http import shared_http_client
+from ...config.model_config import QWEN_ROLE_MAP, qwen_max_config
 from ...tools.tavily import tavily_tool
 from ...tools.ask_user_question import ask_user_question_tool
 from .prompts import FULL_INSTRUCTIONS
 
+
+class PromptCachingOpenAIChat(OpenAIChat):
+    """OpenAIChat that marks the system prompt as a cacheable prefix.
+
+    FULL_INSTRUCTIONS never changes between requests, so the system block is
+    sent with ``cache_control: {"type": "ephemeral"}``, letting DashScope (and
+    other OpenAI-compatible providers with explicit caching) reuse the
+    processed prefix instead of re-reading it on every call.
+    """
+
+    def _format_message(self, message: Message) -> Dict[str, Any]:
+        message_dict = super()._format_message(message)
+        if message.role == "system" and isinstance(message_dict["content"], str):
+            message_dict["content"] = [
+                {
+                    "type": "text",
+                    "text": message_dict["content"],
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        return message_dict
+
+
+# Bounds how many tool calls of one run execute at once when the model emits
+# several. Agno already executes independent calls concurrently and holds back
+# requires_user_input tools (ask_user_question) until the run is resumed.
+# Each run gets its own semaphore (with a count of the calls using it), so
+# concurrent users never wait on each other's tool calls.
+_run_slots: Dict[str, Tuple[threading.BoundedSemaphore, int]] = {}
+_run_slots_lock = threading.Lock()
+
+
+@contextmanager
+def _run_slot(run_id: str) -> Iterator[None]:
+    """Hold one of the ``tool_concurrency_limit`` slots of a run."""
+    with _run_slots_lock:
+        slots, users = _run_slots.get(run_id) or (
+            threading.BoundedSemaphore(tool_concurrency_limit),
+            0,
+        )
+        _run_slots[run_id] = (slots, users + 1)
+    try:
+        with slots:
+            yield
+    finally:
+        with _run_slots_lock:
+            slots, users = _run_slots[run_id]
+            if users == 1:
+                del _run_slots[run_id]
+            else:
+                _run_slots[run_id] = (slots, users - 1)
+
+
+def limit_tool_concurrency(
+    function_name: str,
+    function_call: Callable,
+    arguments: Dict[str, Any],
+    run_context: Optional[RunContext] = None,
+) -> Any:
+    """Tool hook that caps concurrent tool executions within one run."""
+    if run_context is None:
+        return function_call(**arguments)
+    with _run_slot(run_context.run_id):
+        return function_call(**arguments)
+
+
 # Initialize model - using qwen-max for better instruction following
-model = OpenAIChat(
+model = PromptCachingOpenAIChat(
     id=qwen_max_config.model_name,
     api_key=qwen_max_config.api_key,
     base_url=qwen_max_config.base_url,
+    # One connection pool for both agents (same DashScope host)
+    http_client=shared_http_client,
+    # Qwen only returns one tool call per turn unless asked otherwise
+    request_params=(
+        {"parallel_tool_calls": True} if tool_concurrency_limit > 1 else None
+    ),
+    # The response cache only serves deterministic models
+    temperature=0 if llm_cache_enabled else None,
 )
 
 # Fix role mapping for Qwen API
-model.default_role_map = {
-    "system": "system",
-    "user": "user",
-    "assistant": "assistant",
-    "tool": "tool",
-    "model": "assistant",
-}
+model.default_role_map = QWEN_ROLE_MAP
+
+# Opt-in: serve repeated requests from the shared response cache
+if llm_cache_enabled:
+    from ...cache import cache_model_responses
+
+    cache_model_responses(model)
 
 # Create search agent with HITL capabilities
 search_agent = Agent(
     name="SearchAgent",
     model=model,
     tools=[tavily_tool, ask_user_question_tool],
+    # With a limit of 1 the model makes one tool call per turn, so no hook
+    tool_hooks=[limit_tool_concurrency] if tool_concurrency_limit > 1 else None,
     instructions=FULL_INSTRUCTIONS,
     markdown=True,
     stream_events=True,
     store_events=True,
-    events_to_skip=[],
-    stream_intermediate_steps=True,
+    events_to_skip=[RunEvent(name) for name in store_event_mask],
 )
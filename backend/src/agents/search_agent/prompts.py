@@ -4,6 +4,8 @@ This module manages all system instructions and prompts for the Search Agent,
 including the Human-in-the-Loop (HITL) strategy and citation format rules.
 """
 
+import sys
+
 SYSTEM_INSTRUCTIONS = """You are a professional web search assistant powered by the Tavily search engine.
 Your task is to help users find accurate and up-to-date information from the web,
 and provide well-organized answers with proper source citations.
@@ -122,20 +124,20 @@ CITATION_NOTES = """## Important Notes
 - ❌ Do not use other formats or omit any parts
 """
 
-# Combined full instructions
-FULL_INSTRUCTIONS = f"""{SYSTEM_INSTRUCTIONS}
-
-{HITL_STRATEGY}
-
-{WHEN_TO_ASK}
-
-{HITL_EXAMPLES}
-
-{INTERACTION_FLOW}
-
-{CITATION_FORMAT_RULES}
-
-{RESPONSE_TEMPLATE}
-
-{CITATION_NOTES}
-"""
+# Combined full instructions. Every block is static, so the joined string is
+# byte-identical across requests and forms a stable prefix for provider-side
+# prompt caching. Interned so every reference shares the one object.
+FULL_INSTRUCTIONS = sys.intern(
+    "\n\n".join(
+        (
+            SYSTEM_INSTRUCTIONS,
+            HITL_STRATEGY,
+            WHEN_TO_ASK,
+            HITL_EXAMPLES,
+            INTERACTION_FLOW,
+            CITATION_FORMAT_RULES,
+            RESPONSE_TEMPLATE,
+            CITATION_NOTES,
+        )
+    )
+)
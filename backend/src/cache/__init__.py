@@ -0,0 +1,6 @@
+"""Opt-in response caching for deterministic agent models."""
+
+from .llm_cache import LLMResponseCache, cache_model_responses, llm_cache
+from .semantic_cache import SemanticCache
+
+__all__ = ["LLMResponseCache", "SemanticCache", "cache_model_responses", "llm_cache"]
@@ -0,0 +1,224 @@
+"""Exact-match in-memory cache for model responses.
+
+The cache plugs into Agno's model-level response cache hooks, so a hit
+replays the stored ModelResponse (including the tool calls it made) instead
+of calling the provider again. The agent run loop, events and session
+handling are untouched.
+
+An optional SemanticCache acts as a second tier: when the exact key misses,
+a paraphrase of the latest user message in the same conversation context can
+still hit.
+
+Only deterministic models (``temperature == 0``) are cached: replaying a
+sampled answer would silently change the agent's behaviour.
+
+Example:
+    >>> from src.cache import cache_model_responses
+    >>> model = cache_model_responses(OpenAIChat(id="qwen-plus", temperature=0))
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from cachetools import TTLCache
+from loguru import logger
+
+from .semantic_cache import SemanticCache, create_semantic_cache
+
+
+def _fingerprint(payload: Dict[str, Any]) -> str:
+    serialized = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _semantic_query(messages: List[Message]) -> Optional[str]:
+    """Return the text of a trailing user message, the semantic lookup query."""
+    last = messages[-1] if messages else None
+    if last is not None and last.role == "user" and isinstance(last.content, str):
+        return last.content
+    return None
+
+
+class LLMResponseCache:
+    """SHA-256 keyed TTL cache holding serialized model responses."""
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        ttl: int = 3600,
+        semantic: Optional[SemanticCache] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+            ttl: Seconds before a cached response expires
+            semantic: Optional similarity tier consulted on exact misses
+        """
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._semantic = semantic
+        # Context hash and query text of keys awaiting a semantic lookup/save
+        self._queries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._semantic_hits = 0
+        self._misses = 0
+
+    def make_key(
+        self, model: Model, messages: List[Message], stream: bool, **kwargs: Any
+    ) -> str:
+        """Build the cache key from the model, conversation and tool names."""
+        tools = kwargs.get("tools") or []
+        payload = {
+            "model": model.id,
+            "messages": [
+                {
+                    "role": msg.role,
+                    "content": msg.content,
+                    "tool_calls": msg.tool_calls,
+                }
+                for msg in messages
+            ],
+            "tools": [getattr(tool, "name", tool) for tool in tools],
+            "response_format": kwargs.get("response_format"),
+            "stream": stream,
+        }
+        key = _fingerprint(payload)
+
+        query = _semantic_query(messages) if self._semantic is not None else None
+        if query is not None:
+            payload["messages"] = payload["messages"][:-1]
+            with self._lock:
+                self._queries[key] = (_fingerprint(payload), query)
+        return key
+
+    async def prepare(self, messages: List[Message]) -> None:
+        """Embed the semantic query off the event loop before an async lookup."""
+        query = _semantic_query(messages) if self._semantic is not None else None
+        if query is not None:
+            await self._semantic.prepare(query)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``key``, or None on a miss."""
+        with self._lock:
+            entry = self._cache.get(key)
+            query = self._queries.get(key)
+            if entry is not None:
+                self._hits += 1
+                return entry
+
+        if self._semantic is not None and query is not None:
+            entry = self._semantic.get(*query)
+
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+            else:
+                self._semantic_hits += 1
+        return entry
+
+    def _store(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._cache[key] = entry
+            query = self._queries.pop(key, None)
+        if self._semantic is not None and query is not None:
+            self._semantic.add(*query, entry)
+
+    def save_response(
+        self, key: str, result: ModelResponse, is_streaming: bool = False
+    ) -> None:
+        """Store a non-streaming model response."""
+        self._store(key, {"is_streaming": is_streaming, "result": result.to_dict()})
+
+    def save_streaming_responses(
+        self, key: str, responses: List[ModelResponse]
+    ) -> None:
+        """Store the chunks of a streaming model response."""
+        self._store(
+            key,
+            {
+                "is_streaming": True,
+                "streaming_responses": [r.to_dict() for r in responses],
+            },
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current number of entries."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "semantic_hits": self._semantic_hits,
+                "misses": self._misses,
+                "size": len(self._cache),
+                "semantic_size": len(self._semantic) if self._semantic else 0,
+                "maxsize": int(self._cache.maxsize),
+            }
+
+    def clear(self) -> None:
+        """Drop all exact-match entries and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self._queries.clear()
+            self._hits = 0
+            self._semantic_hits = 0
+            self._misses = 0
+
+
+# Process-wide cache shared by all agents
+llm_cache = LLMResponseCache(
+    maxsize=int(os.getenv("LLM_CACHE_MAXSIZE", "1000")),
+    ttl=int(os.getenv("LLM_CACHE_TTL", "3600")),
+    semantic=create_semantic_cache(),
+)
+
+
+def cache_model_responses(model: Model, cache: LLMResponseCache = llm_cache) -> Model:
+    """
+    Route a model's response cache through an in-memory LLMResponseCache.
+
+    Models without ``temperature == 0`` are returned unchanged.
+
+    Args:
+        model: The Agno model to cache
+        cache: Cache instance to use (defaults to the shared ``llm_cache``)
+
+    Returns:
+        The same model instance
+    """
+    if getattr(model, "temperature", None) != 0:
+        logger.debug(f"Response cache disabled for {model.id}: temperature is not 0")
+        return model
+
+    def _make_key(messages: List[Message], stream: bool, **kwargs: Any) -> str:
+        return cache.make_key(model, messages, stream, **kwargs)
+
+    model.cache_response = True
+    model._get_model_cache_key = _make_key  # type: ignore[method-assign]
+    model._get_cached_model_response = cache.get  # type: ignore[method-assign]
+    model._save_model_response_to_cache = cache.save_response  # type: ignore[method-assign]
+    model._save_streaming_responses_to_cache = cache.save_streaming_responses  # type: ignore[method-assign]
+
+    if cache._semantic is not None:
+        # Agno calls the cache hooks synchronously inside its async response
+        # methods, so embed the query in a worker thread before they run
+        aresponse, aresponse_stream = model.aresponse, model.aresponse_stream
+
+        async def _aresponse(*args: Any, **kwargs: Any) -> ModelResponse:
+            await cache.prepare(kwargs.get("messages", args[0] if args else []))
+            return await aresponse(*args, **kwargs)
+
+        async def _aresponse_stream(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+            await cache.prepare(kwargs.get("messages", args[0] if args else []))
+            async for chunk in aresponse_stream(*args, **kwargs):
+                yield chunk
+
+        model.aresponse = _aresponse  # type: ignore[method-assign]
+        model.aresponse_stream = _aresponse_stream  # type: ignore[method-assign]
+    return model
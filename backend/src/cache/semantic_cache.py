@@ -0,0 +1,225 @@
+"""Semantic (embedding similarity) cache for model responses.
+
+Second cache tier behind the exact-match LLMResponseCache: paraphrased
+queries ("latest AI news" vs "recent news about AI") in the same
+conversation context reuse a stored response when the cosine similarity of
+their embeddings clears a threshold. Embeddings live in one NumPy matrix per
+context, so a lookup is a single matrix-vector product.
+
+Entries are partitioned by a context hash (model, system prompt, history and
+tools), so a response is never served across different conversations.
+
+Embedding is a blocking HTTP call. Inside the event loop it only happens in a
+worker thread: async callers embed the query up front with ``prepare``, and a
+lookup that finds no prepared embedding there is treated as a miss. NumPy is
+imported on first use, since the tier is disabled by default.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from ..config.model_config import qwen_model_config
+
+if TYPE_CHECKING:
+    import numpy as np
+
+Embedder = Callable[[str], "np.ndarray"]
+
+
+def _in_event_loop() -> bool:
+    """Return True when called from a thread running an asyncio loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class _ContextIndex:
+    """Normalized embeddings and entries that share one context hash."""
+
+    def __init__(self, dim: int):
+        import numpy as np
+
+        self.matrix = np.empty((0, dim), dtype=np.float32)
+        self.expires_at: List[float] = []
+        self.values: List[Dict[str, Any]] = []
+
+
+class SemanticCache:
+    """Cosine-similarity cache keyed by conversation context."""
+
+    def __init__(
+        self,
+        embed: Embedder,
+        threshold: float = 0.92,
+        maxsize: int = 1000,
+        ttl: int = 3600,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embed: Function returning a 1-D embedding for a query string
+            threshold: Minimum cosine similarity counted as a hit
+            maxsize: Maximum number of entries across all contexts
+            ttl: Seconds before an entry expires
+        """
+        self._embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._indexes: Dict[str, _ContextIndex] = {}
+        self._order: List[Tuple[str, float]] = []
+        # Query embeddings computed off the event loop by prepare()
+        self._prepared: Dict[str, "np.ndarray"] = {}
+        self._lock = threading.Lock()
+
+    def _embed_normalized(self, text: str) -> Optional["np.ndarray"]:
+        import numpy as np
+
+        try:
+            vector = np.asarray(self._embed(text), dtype=np.float32).ravel()
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    async def prepare(self, query: str) -> None:
+        """Embed ``query`` in a worker thread ahead of a lookup from the loop."""
+        with self._lock:
+            if query in self._prepared:
+                return
+        vector = await asyncio.to_thread(self._embed_normalized, query)
+        if vector is None:
+            return
+        with self._lock:
+            self._prepared[query] = vector
+            if len(self._prepared) > self.maxsize:
+                del self._prepared[next(iter(self._prepared))]
+
+    def _query_vector(self, query: str, consume: bool) -> Optional["np.ndarray"]:
+        """Return the prepared embedding, embedding inline only off the loop."""
+        with self._lock:
+            if consume:
+                vector = self._prepared.pop(query, None)
+            else:
+                vector = self._prepared.get(query)
+        if vector is None and not _in_event_loop():
+            vector = self._embed_normalized(query)
+        return vector
+
+    def get(self, context: str, query: str) -> Optional[Dict[str, Any]]:
+        """Return the closest cached entry for ``query`` within ``context``."""
+        import numpy as np
+
+        with self._lock:
+            if context not in self._indexes:
+                return None
+
+        vector = self._query_vector(query, consume=False)
+        if vector is None:
+            return None
+
+        with self._lock:
+            index = self._indexes.get(context)
+            if index is None or index.matrix.shape[1] != vector.shape[0]:
+                return None
+            scores = index.matrix @ vector
+            scores[np.asarray(index.expires_at) < time.monotonic()] = -1.0
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            logger.debug(f"Semantic cache hit (similarity {scores[best]:.3f})")
+            return index.values[best]
+
+    def add(self, context: str, query: str, value: Dict[str, Any]) -> None:
+        """Index ``value`` under the embedding of ``query``."""
+        import numpy as np
+
+        vector = self._query_vector(query, consume=True)
+        if vector is None:
+            if _in_event_loop():
+                # Not prepared: embed and index from a worker thread instead
+                asyncio.get_running_loop().run_in_executor(
+                    None, self.add, context, query, value
+                )
+            return
+
+        with self._lock:
+            index = self._indexes.get(context)
+            if index is None or index.matrix.shape[1] != vector.shape[0]:
+                if index is not None:
+                    # The old entries go with their index, so drop their FIFO slots
+                    self._order = [item for item in self._order if item[0] != context]
+                index = self._indexes[context] = _ContextIndex(vector.shape[0])
+            expires_at = time.monotonic() + self.ttl
+            index.matrix = np.vstack((index.matrix, vector))
+            index.expires_at.append(expires_at)
+            index.values.append(value)
+            self._order.append((context, expires_at))
+            if len(self._order) > self.maxsize:
+                self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        context, _ = self._order.pop(0)
+        index = self._indexes[context]
+        index.matrix = index.matrix[1:]
+        del index.expires_at[0]
+        del index.values[0]
+        if not index.values:
+            del self._indexes[context]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._order)
+
+
+def dashscope_embedder(
+    model: str = "text-embedding-v4", dimensions: int = 512
+) -> Embedder:
+    """
+    Create an embedder backed by the DashScope OpenAI-compatible API.
+
+    Args:
+        model: Embedding model name
+        dimensions: Output vector size
+
+    Returns:
+        Function mapping a string to its embedding
+    """
+    import numpy as np
+    from openai import OpenAI
+
+    client = OpenAI(
+        api_key=qwen_model_config.api_key, base_url=qwen_model_config.base_url
+    )
+
+    def embed(text: str) -> np.ndarray:
+        response = client.embeddings.create(
+            model=model, input=text, dimensions=dimensions
+        )
+        return np.asarray(response.data[0].embedding, dtype=np.float32)
+
+    return embed
+
+
+def create_semantic_cache() -> Optional[SemanticCache]:
+    """Build the semantic tier from environment settings, if enabled."""
+    if os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() != "true":
+        return None
+    return SemanticCache(
+        embed=dashscope_embedder(
+            model=os.getenv("SEMANTIC_CACHE_MODEL", "text-embedding-v4"),
+            dimensions=int(os.getenv("SEMANTIC_CACHE_DIMENSIONS", "512")),
+        ),
+        threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92")),
+        maxsize=int(os.getenv("LLM_CACHE_MAXSIZE", "1000")),
+        ttl=int(os.getenv("LLM_CACHE_TTL", "3600")),
+    )
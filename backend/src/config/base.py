@@ -1,6 +1,35 @@
-import dotenv
 import os
 
+
+def env_flag(name: str) -> bool:
+    """Read a boolean environment flag ("1", "true", "yes" or "on" enable it)."""
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+# backend/.env is loaded by the src package before this module runs
 environment = os.getenv("ENVIRONMENT", "development")
 
-dotenv.load_dotenv(".env")
+# Maximum number of tool calls of one run executed concurrently.
+# 1 keeps the model to a single tool call per turn.
+tool_concurrency_limit = max(1, int(os.getenv("TOOL_CONCURRENCY_LIMIT", "1")))
+
+# Run events streamed to clients but not kept on the stored run output
+# (comma-separated RunEvent names). Token-level content events make up most
+# of a run, so storing them grows memory with the length of every response.
+store_event_mask = [
+    name.strip()
+    for name in os.getenv(
+        "STORE_EVENT_MASK", "RunContent,RunIntermediateContent,ToolCallStarted"
+    ).split(",")
+    if name.strip()
+]
+
+# Worker threads for blocking tool calls across all concurrent runs. They live
+# in the event loop's default executor, which the server enlarges by a few
+# threads for the loop's own blocking work (DNS lookups).
+tool_thread_pool_size = max(1, int(os.getenv("TOOL_THREAD_POOL_SIZE", "10")))
+
+# Serve repeated requests of the bundled agents from the in-memory response
+# cache (src.cache, needs the "cache" extra). Only deterministic models can be
+# cached, so enabling it also runs both agents at temperature 0.
+llm_cache_enabled = env_flag("LLM_CACHE_ENABLED")
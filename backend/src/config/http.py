@@ -0,0 +1,14 @@
+"""Shared HTTP client for model API calls.
+
+Both agents talk to the same DashScope host, so they share one
+``httpx.AsyncClient`` connection pool instead of each OpenAIChat model
+opening its own. HTTP/2 lets concurrent requests (e.g. parallel tool-call
+turns) multiplex over a single connection.
+"""
+
+import httpx
+
+shared_http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+)
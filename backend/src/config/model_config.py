@@ -6,21 +6,27 @@ with essential parameters: api_key, base_url, and model_name.
 """
 
 import os
-from typing import Optional
+from types import MappingProxyType
+from typing import Final, Mapping, Optional
 from dataclasses import dataclass, field
+from loguru import logger
 from pydantic import BaseModel, Field
-from .base import environment
+from .base import env_flag, environment
 
-print(f"Loading ModelConfig in {environment} environment")
+# Set AGENT_UI_PRINT_CONFIG=true to log the loaded model configs at startup
+print_config = env_flag("AGENT_UI_PRINT_CONFIG")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     """
     Simplified OpenAI Chat model configuration.
 
     This configuration class contains only the essential parameters needed
     for OpenAI chat models: api_key, base_url, and model_name.
+
+    Instances are immutable and hashable, so they can be shared and used as
+    cache keys.
     """
 
     api_key: Optional[str] = field(default=None)
@@ -29,15 +35,21 @@ class ModelConfig:
 
     def __post_init__(self):
         """Post-initialization to set default values from environment and validate."""
+        # Frozen dataclass: normalized values are set through object.__setattr__
         if self.api_key is None:
-            self.api_key = os.getenv("OPENAI_API_KEY")
+            object.__setattr__(self, "api_key", os.getenv("OPENAI_API_KEY"))
         if self.base_url is None:
-            self.base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+            object.__setattr__(
+                self,
+                "base_url",
+                os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
+            )
 
         # Validate model name
-        if not self.model_name or not self.model_name.strip():
+        model_name = (self.model_name or "").strip()
+        if not model_name:
             raise ValueError("model_name cannot be empty")
-        self.model_name = self.model_name.strip()
+        object.__setattr__(self, "model_name", model_name)
 
         # Validate API key
         if self.api_key is not None and not self.api_key.strip():
@@ -107,7 +119,18 @@ class ModelConfigRequest(BaseModel):
         )
 
 
-qwen_model_config = ModelConfig().from_dict(
+# Role mapping for the Qwen (DashScope) API, shared read-only by all models
+QWEN_ROLE_MAP: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "system": "system",
+        "user": "user",
+        "assistant": "assistant",
+        "tool": "tool",
+        "model": "assistant",
+    }
+)
+
+qwen_model_config = ModelConfig.from_dict(
     {
         "api_key": os.getenv("DASHSCOPE_API_KEY"),
         "base_url": os.getenv("DASHSCOPE_BASE_URL"),
@@ -115,7 +138,7 @@ qwen_model_config = ModelConfig().from_dict(
     }
 )
 
-qwen_max_config = ModelConfig().from_dict(
+qwen_max_config = ModelConfig.from_dict(
     {
         "api_key": os.getenv("DASHSCOPE_API_KEY"),
         "base_url": os.getenv("DASHSCOPE_BASE_URL"),
@@ -123,4 +146,18 @@ qwen_max_config = ModelConfig().from_dict(
     }
 )
 
-print("Qwen Model Config:", qwen_model_config.to_dict())
+
+def _redacted(config: ModelConfig) -> dict:
+    """Return the configuration as a dict with the API key masked, for logging."""
+    return {**config.to_dict(), "api_key": "***" if config.api_key else None}
+
+
+def log_model_configs() -> None:
+    """Log the environment and the loaded model configs with API keys masked."""
+    # Info level, so the dump passes the server's default log sink
+    logger.info("Loading ModelConfig in {} environment", environment)
+    logger.info("Qwen Model Config: {}", _redacted(qwen_model_config))
+
+
+if print_config:
+    log_model_configs()
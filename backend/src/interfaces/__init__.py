@@ -0,0 +1,5 @@
+"""Custom AgentOS interfaces."""
+
+from .agui import BufferedAGUI
+
+__all__ = ["BufferedAGUI"]
@@ -0,0 +1,226 @@
+"""AG-UI interface that coalesces streamed text before sending it.
+
+Agno's AGUI interface emits one SSE event per model token. BufferedAGUI
+exposes the same ``/agui`` and ``/status`` routes but merges consecutive
+``TEXT_MESSAGE_CONTENT`` deltas of a message and flushes them when:
+
+- the buffered text ends a sentence,
+- the buffer holds more than ``MAX_WORDS`` words,
+- the current batch size is reached, or
+- ``FLUSH_INTERVAL`` seconds passed since the first buffered delta.
+
+The batch size starts at 1 for every new message, so the first token goes out
+immediately, then grows by ``BATCH_GROWTH`` after each flush up to
+``MAX_BATCH`` deltas. All other events pass through unchanged and in order.
+
+Encoded SSE frames that are already waiting when the response is ready to
+send are joined into one body chunk (up to ``MAX_SEND_BATCH`` frames), so a
+burst of events costs one ASGI send instead of one per event.
+
+Each stage reads its input through a queue of at most ``MAX_QUEUED_EVENTS``
+items, so a slow client throttles the agent stream instead of letting it
+buffer without limit.
+"""
+
+import asyncio
+import re
+from typing import AsyncIterator, Callable, List, Optional
+
+from ag_ui.core import BaseEvent, EventType, RunAgentInput, TextMessageContentEvent
+from ag_ui.encoder import EventEncoder
+from agno.agent import Agent
+from agno.os.interfaces.agui import AGUI
+from agno.os.interfaces.agui.router import run_agent, run_team
+from agno.team import Team
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+FLUSH_INTERVAL = 0.04
+MAX_WORDS = 80
+MIN_BATCH = 1
+MAX_BATCH = 50
+BATCH_GROWTH = 3
+MAX_SEND_BATCH = 32
+MAX_QUEUED_EVENTS = 64
+
+_SENTENCE_END = re.compile(r"[.?!。？！]\s*$")
+_END_OF_STREAM = object()
+
+
+class _TextBuffer:
+    """Pending deltas of one text message."""
+
+    def __init__(self) -> None:
+        self.message_id: Optional[str] = None
+        self.parts: List[str] = []
+        self.batch_size = MIN_BATCH
+        self.deadline = 0.0
+
+    def add(self, event: TextMessageContentEvent, now: float) -> bool:
+        """Buffer a delta and return True when the buffer should be flushed."""
+        if event.message_id != self.message_id:
+            self.message_id = event.message_id
+            self.batch_size = MIN_BATCH
+        if not self.parts:
+            self.deadline = now + FLUSH_INTERVAL
+        self.parts.append(event.delta)
+        text = "".join(self.parts)
+        return (
+            len(self.parts) >= self.batch_size
+            or _SENTENCE_END.search(text) is not None
+            or len(text.split()) > MAX_WORDS
+        )
+
+    def flush(self) -> TextMessageContentEvent:
+        """Merge the buffered deltas into one event and grow the batch size."""
+        event = TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id=self.message_id,
+            delta="".join(self.parts),
+        )
+        self.parts = []
+        self.batch_size = min(self.batch_size * BATCH_GROWTH, MAX_BATCH)
+        return event
+
+
+async def _pump(events: AsyncIterator[BaseEvent], queue: asyncio.Queue) -> None:
+    """Move ``events`` into ``queue``, forwarding errors and the end of stream.
+
+    Waits for room in the bounded queue, so the producer runs no further ahead
+    of the consumer than the queue size.
+    """
+    try:
+        async for event in events:
+            await queue.put(event)
+    except Exception as e:
+        await queue.put(e)
+    await queue.put(_END_OF_STREAM)
+
+
+async def coalesce_text_events(
+    events: AsyncIterator[BaseEvent],
+) -> AsyncIterator[BaseEvent]:
+    """
+    Merge consecutive text deltas of an AG-UI event stream.
+
+    Args:
+        events: AG-UI events as produced by the agent or team run
+
+    Yields:
+        The same events, with TEXT_MESSAGE_CONTENT deltas batched
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUED_EVENTS)
+    loop = asyncio.get_running_loop()
+    producer = asyncio.create_task(_pump(events, queue))
+    buffer = _TextBuffer()
+    try:
+        while True:
+            timeout = max(buffer.deadline - loop.time(), 0) if buffer.parts else None
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield buffer.flush()
+                continue
+
+            if isinstance(item, TextMessageContentEvent):
+                if buffer.parts and item.message_id != buffer.message_id:
+                    yield buffer.flush()
+                if buffer.add(item, loop.time()):
+                    yield buffer.flush()
+                continue
+
+            if buffer.parts:
+                yield buffer.flush()
+            if item is _END_OF_STREAM:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+
+
+async def encode_in_batches(
+    events: AsyncIterator[BaseEvent],
+    encode: Callable[[BaseEvent], str],
+    max_batch: int = MAX_SEND_BATCH,
+) -> AsyncIterator[str]:
+    """
+    Encode events as SSE frames, joining frames that are ready together.
+
+    Args:
+        events: AG-UI events to send
+        encode: Function turning one event into its SSE frame
+        max_batch: Maximum number of frames joined into one chunk
+
+    Yields:
+        Chunks of one or more complete SSE frames
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUED_EVENTS)
+    producer = asyncio.create_task(_pump(events, queue))
+    try:
+        while True:
+            batch = [await queue.get()]
+            # Let the producer enqueue whatever is already available
+            await asyncio.sleep(0)
+            while len(batch) < max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            frames: List[str] = []
+            for item in batch:
+                if item is _END_OF_STREAM or isinstance(item, Exception):
+                    if frames:
+                        yield "".join(frames)
+                    if item is _END_OF_STREAM:
+                        return
+                    raise item
+                frames.append(encode(item))
+            yield "".join(frames)
+    finally:
+        producer.cancel()
+
+
+def attach_routes(
+    router: APIRouter, agent: Optional[Agent] = None, team: Optional[Team] = None
+) -> APIRouter:
+    """Attach the buffered ``/agui`` and ``/status`` routes to ``router``."""
+    if agent is None and team is None:
+        raise ValueError("Either agent or team must be provided.")
+
+    encoder = EventEncoder()
+
+    @router.post("/agui", name="run_agent")
+    async def run_agent_agui(run_input: RunAgentInput):
+        if agent:
+            events = run_agent(agent, run_input)
+        else:
+            events = run_team(team, run_input)  # type: ignore[arg-type]
+
+        return StreamingResponse(
+            encode_in_batches(coalesce_text_events(events), encoder.encode),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "Access-Control-Allow-Origin": "*",
+                "Access-Control-Allow-Methods": "POST, GET, OPTIONS",
+                "Access-Control-Allow-Headers": "*",
+            },
+        )
+
+    @router.get("/status")
+    async def get_status():
+        return {"status": "available"}
+
+    return router
+
+
+class BufferedAGUI(AGUI):
+    """AGUI interface that sends text in sentence-sized chunks."""
+
+    def get_router(self) -> APIRouter:
+        self.router = APIRouter(prefix=self.prefix, tags=self.tags)  # type: ignore
+        self.router = attach_routes(
+            router=self.router, agent=self.agent, team=self.team
+        )
+        return self.router
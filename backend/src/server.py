@@ -3,62 +3,154 @@ FastAPI server for AI Agent services with AG-UI protocol integration.
 """
 
 import argparse
+import asyncio
 import os
+import random
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any
 
-# Add the backend directory to the Python path
-backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir))
-
-from dotenv import load_dotenv
+import orjson
 from agno.os import AgentOS
-from agno.os.interfaces.agui import AGUI
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from loguru import logger
 
+# backend/.env is loaded by the src package before this module runs
 
-# Load environment variables
-load_dotenv()
-
-# Configure logging
+# Configure logging (set LOG_COLORIZE=false in production to skip ANSI styling;
+# unset means colorize only when stderr is a terminal)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").strip().upper()
+log_colorize = os.getenv("LOG_COLORIZE")
+# Replace loguru's default stderr handler so each record is written once
+logger.remove()
 logger.add(
     sys.stderr,
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level="INFO",
+    level=LOG_LEVEL,
+    colorize=None if log_colorize is None else log_colorize.lower() == "true",
 )
 
+# Fraction of HTTP requests logged by the request middleware
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+
 # Import agents
 from src.agents.chat_agent import chat_agent
 from src.agents.search_agent import search_agent
+from src.config.base import llm_cache_enabled, tool_thread_pool_size
+from src.config.http import shared_http_client
+from src.config.model_config import qwen_model_config
+from src.interfaces import BufferedAGUI
+
+# Upper bound on startup warm-up so an unreachable backend never delays readiness
+WARMUP_TIMEOUT = 3.0
+
+# Default-executor threads kept beyond TOOL_THREAD_POOL_SIZE for the loop's own
+# blocking work (getaddrinfo for new connections, other run_in_executor calls)
+LOOP_EXECUTOR_HEADROOM = 4
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+async def warm_model_connection() -> None:
+    """Open a pooled connection to the model API host ahead of the first request."""
+    await asyncio.wait_for(
+        shared_http_client.head(qwen_model_config.base_url), timeout=WARMUP_TIMEOUT
+    )
+
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Agno runs sync tools with asyncio.to_thread, which always uses the loop's
+    # default executor, so tools cannot get a pool of their own. Replacing the
+    # default executor affects every run_in_executor(None, ...) on the loop,
+    # including DNS lookups, so the pool is sized for tool calls plus headroom
+    # and closed on shutdown.
+    tool_pool = ThreadPoolExecutor(
+        max_workers=tool_thread_pool_size + LOOP_EXECUTOR_HEADROOM,
+        thread_name_prefix="executor-",
+    )
+    asyncio.get_running_loop().set_default_executor(tool_pool)
+    app.state.tool_pool = tool_pool
+
+    # Both agents share this connection pool, so one request pays the
+    # DNS/TLS setup at startup instead of the first user's time to first token
+    try:
+        await warm_model_connection()
+        logger.info("Model API connection warmed up")
+    except Exception as e:
+        logger.warning(f"Model API warm-up skipped: {e!r}")
+    yield
+    try:
+        await shared_http_client.aclose()
+    finally:
+        tool_pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Base app handed to AgentOS so every JSON route it registers uses orjson.
+# AG-UI events are streamed as SSE and encoded by pydantic, not by this class.
+base_app = FastAPI(
+    title="agent-ui-backend",
+    description="AI Agent backend with chat and search capabilities",
+    default_response_class=OrjsonResponse,
+    lifespan=lifespan,
+)
 
 # Create AgentOS with multiple agents
 # Each agent gets its own AGUI endpoint with a unique prefix
 # Note: AGUI adds "/agui" suffix automatically, so prefix="/chat" results in "/chat/agui"
+# BufferedAGUI batches streamed text deltas into sentence-sized events
 agent_os = AgentOS(
     id="agent-ui-backend",
     description="AI Agent backend with chat and search capabilities",
     agents=[chat_agent, search_agent],
     # Expose all agents via AG-UI with different prefixes
     interfaces=[
-        AGUI(chat_agent, prefix="/chat"),  # Results in /chat/agui
-        AGUI(search_agent, prefix="/search"),  # Results in /search/agui
+        BufferedAGUI(chat_agent, prefix="/chat"),  # Results in /chat/agui
+        BufferedAGUI(search_agent, prefix="/search"),  # Results in /search/agui
     ],
+    base_app=base_app,
 )
 
 # Get the FastAPI app from AgentOS
 app = agent_os.get_app()
 
 
-# Add middleware to log all requests
+# Add middleware to log a sample of requests
 @app.middleware("http")
 async def log_requests(request, call_next):
-    logger.info(f"Incoming request: {request.method} {request.url.path}")
+    # AG-UI streams are long-lived SSE responses; they are not logged here
+    if request.url.path.endswith("/agui") or random.random() >= LOG_SAMPLE_RATE:
+        return await call_next(request)
+
     response = await call_next(request)
-    logger.info(f"Response status: {response.status_code}")
+    logger.opt(lazy=True).info(
+        "{m} {p} -> {s}",
+        m=lambda: request.method,
+        p=lambda: request.url.path,
+        s=lambda: response.status_code,
+    )
     return response
 
 
+@app.get("/cache/stats")
+async def cache_stats():
+    """Return hit/miss counters of the in-memory LLM response cache."""
+    if not llm_cache_enabled:
+        return {"enabled": False}
+    from src.cache import llm_cache
+
+    return {"enabled": True, **llm_cache.stats()}
+
+
 if agent_os.agents:
     logger.info(
         f"AgentOS initialized with agents: {[agent.name for agent in agent_os.agents]}"
@@ -5,14 +5,23 @@ This module provides the tool wrapper and exports the main functions.
 """
 
 from typing import Optional
+
 from agno.tools import tool
 
-from .core import ask_user_question, create_question, QuestionOption, Question
+from .core import (
+    ask_user_question,
+    ask_user_question_dict,
+    create_question,
+    QuestionOption,
+    Question,
+)
+from .schema import QUESTIONS_JSON_SCHEMA
 
 # Export core components for direct use
 __all__ = [
     "ask_user_question_tool",
     "ask_user_question",
+    "ask_user_question_dict",
     "create_question",
     "QuestionOption",
     "Question",
@@ -27,90 +36,14 @@ __all__ = [
         "Supports single-choice and multiple-choice questions with 2-4 options each. "
         "Users can always provide custom input via an automatic 'Other' option."
     ),
-    instructions="""
-CRITICAL: When using this tool, you MUST provide questions_json in the EXACT format below.
-
-REQUIRED JSON FORMAT:
-```json
-[
-  {
-    "question": "The question text to ask the user",
-    "header": "ShortLabel",
-    "options": [
-      {"label": "Option 1", "description": "Description of option 1"},
-      {"label": "Option 2", "description": "Description of option 2"}
-    ],
-    "multiSelect": false
-  }
-]
-```
-
-REQUIRED FIELDS (ALL MUST be present):
-- question (string): The question text
-- header (string): Short label (MAX 12 characters)
-- options (array): 2-4 option objects, each with:
-  - label (string): The option label/name
-  - description (string): Explanation of this option
-- multiSelect (boolean): true for multiple choice, false for single choice
-
-EXAMPLES:
-
-Example 1 - Material Type Selection:
-```json
-[
-  {
-    "question": "Which type of steel data do you need?",
-    "header": "Steel Type",
-    "options": [
-      {"label": "Production", "description": "Primary steel production data"},
-      {"label": "Market", "description": "Steel market average data"},
-      {"label": "Alloy", "description": "Specific steel alloy"}
-    ],
-    "multiSelect": false
-  }
-]
-```
-
-Example 2 - Multiple Questions:
-```json
-[
-  {
-    "question": "Which region's data do you need?",
-    "header": "Region",
-    "options": [
-      {"label": "CN", "description": "China regional data"},
-      {"label": "GLO", "description": "Global average"},
-      {"label": "RoW", "description": "Rest of World"}
-    ],
-    "multiSelect": false
-  },
-  {
-    "question": "Select data sources (can choose multiple):",
-    "header": "Sources",
-    "options": [
-      {"label": "Database A", "description": "Primary database"},
-      {"label": "Ecoinvent", "description": "International database"}
-    ],
-    "multiSelect": true
-  }
-]
-```
-
-COMMON MISTAKES TO AVOID:
-- ❌ Missing "header" field
-- ❌ Missing "multiSelect" field
-- ❌ Options as simple strings instead of {label, description} objects
-- ❌ Header longer than 12 characters
-- ❌ Less than 2 or more than 4 options
-- ❌ Missing "description" in options
-
-CORRECT USAGE:
-✅ All fields present
-✅ Options as objects with label and description
-✅ Header ≤ 12 chars
-✅ 2-4 options per question
-✅ multiSelect as boolean (true/false)
-    """,
+    instructions=(
+        "questions_json MUST be a JSON string whose value matches this JSON Schema:\n"
+        f"{QUESTIONS_JSON_SCHEMA}\n"
+        'Example: [{"question": "Which region\'s data do you need?", '
+        '"header": "Region", "options": [{"label": "CN", "description": '
+        '"China regional data"}, {"label": "GLO", "description": "Global average"}], '
+        '"multiSelect": false}]'
+    ),
     requires_user_input=True,
     user_input_fields=["user_answers"],
 )
@@ -153,4 +86,5 @@ def ask_user_question_tool(
         )
         ```
     """
+    # Core decodes (cached between the prompt and answer calls) and validates
     return ask_user_question(questions_json=questions_json, user_answers=user_answers)
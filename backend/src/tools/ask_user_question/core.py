@@ -5,14 +5,50 @@ This module contains the core logic for asking users interactive questions.
 Separated from the tool wrapper to allow direct function calls in tests.
 """
 
-from typing import List, Dict, Any, Optional
-import json
+import functools
+import re
+from typing import List, Dict, Any, Optional, Tuple
+
+import orjson
 from loguru import logger
 
+from .schema import MAX_HEADER_LENGTH, MAX_OPTIONS, MAX_QUESTIONS, MIN_OPTIONS
+
+# Limits shared with the msgspec schema (and its JSON Schema) and the UI
+_MAX_HEADER = MAX_HEADER_LENGTH
+_MIN_OPTIONS, _MAX_OPTIONS = MIN_OPTIONS, MAX_OPTIONS
+_MAX_QUESTIONS = MAX_QUESTIONS
+
+# A question ends with '?', optionally followed by whitespace
+_Q_END = re.compile(r"\?\s*\Z")
+
+_loads = orjson.loads
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to compact JSON text; non-ASCII characters are kept as-is."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _check_question(question: str, header: str, option_count: int) -> None:
+    """Validate the header length and option count of a question."""
+    if len(header) > _MAX_HEADER:
+        raise ValueError(f"Header '{header}' exceeds {_MAX_HEADER} character limit")
+
+    if not _MIN_OPTIONS <= option_count <= _MAX_OPTIONS:
+        raise ValueError(
+            f"Must have {_MIN_OPTIONS}-{_MAX_OPTIONS} options, got {option_count}"
+        )
+
+    if not _Q_END.search(question):
+        logger.warning("Question should end with '?': {}", question)
+
 
 class QuestionOption:
     """Represents a single option in a question."""
 
+    __slots__ = ("label", "description")
+
     def __init__(self, label: str, description: str):
         """
         Initialize a question option.
@@ -32,6 +68,8 @@ class QuestionOption:
 class Question:
     """Represents a single question with options."""
 
+    __slots__ = ("question", "header", "options", "multi_select")
+
     def __init__(
         self,
         question: str,
@@ -48,14 +86,7 @@ class Question:
             options: List of 2-4 QuestionOption objects
             multi_select: If True, allow multiple selections
         """
-        if len(header) > 12:
-            raise ValueError(f"Header '{header}' exceeds 12 character limit")
-
-        if not 2 <= len(options) <= 4:
-            raise ValueError(f"Must have 2-4 options, got {len(options)}")
-
-        if not question.strip().endswith("?"):
-            logger.warning(f"Question should end with '?': {question}")
+        _check_question(question, header, len(options))
 
         self.question = question
         self.header = header
@@ -67,12 +98,191 @@ class Question:
         return {
             "question": self.question,
             "header": self.header,
-            "options": [opt.to_dict() for opt in self.options],
+            "options": [
+                {"label": opt.label, "description": opt.description}
+                for opt in self.options
+            ],
             "multiSelect": self.multi_select,
         }
 
 
-def ask_user_question(questions_json: str, user_answers: Optional[str] = None) -> str:
+def _emit_prompt(questions: Tuple[Dict[str, Any], ...]) -> str:
+    """Serialize the awaiting_user_input response in a single orjson pass.
+
+    The validated question dicts are written as-is (orjson encodes the tuple
+    as an array), so no copy of the question tree is made.
+    """
+    return _dumps(
+        {
+            "questions": questions,
+            "total_questions": len(questions),
+            "status": "awaiting_user_input",
+        }
+    )
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Normalize one answer to a list of selected labels."""
+    if isinstance(value, list):
+        return value
+    return [] if value is None else [value]
+
+
+def _make_option(opt_data: Dict[str, Any], idx: int) -> Dict[str, str]:
+    """Validate one option of question ``idx`` and return it in output shape."""
+    try:
+        label, description = opt_data["label"], opt_data["description"]
+    except KeyError as e:
+        raise ValueError(f"Option in question {idx} missing field {e}") from e
+    if not (isinstance(label, str) and isinstance(description, str)):
+        raise ValueError(f"Option in question {idx} must have string fields")
+    return {"label": label, "description": description}
+
+
+@functools.lru_cache(maxsize=128)
+def _decode_questions(questions_json: str) -> Any:
+    """
+    Decode a questions payload.
+
+    The prompt call and the answer call of one tool invocation receive the
+    same questions_json, so the decoded JSON is cached. It is only read by
+    _validate_questions and never handed to callers.
+
+    Args:
+        questions_json: JSON string containing a list of question objects
+
+    Returns:
+        The decoded JSON value
+
+    Raises:
+        ValueError: If questions_json is not valid JSON
+    """
+    try:
+        return _loads(questions_json)
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"Invalid questions_json format: {e}") from e
+
+
+def _parse_questions(questions_json: str) -> Tuple[Dict[str, Any], ...]:
+    """
+    Parse and validate a questions payload.
+
+    Args:
+        questions_json: JSON string containing a list of question objects
+
+    Returns:
+        Tuple of validated question dicts, built fresh for each call
+
+    Raises:
+        ValueError: If questions_json is invalid or doesn't meet requirements
+    """
+    return _validate_questions(_decode_questions(questions_json))
+
+
+def _validate_questions(questions_data: Any) -> Tuple[Dict[str, Any], ...]:
+    """
+    Validate decoded questions and normalize them to the output shape.
+
+    Args:
+        questions_data: Decoded list of question objects
+
+    Returns:
+        Tuple of validated question dicts
+
+    Raises:
+        ValueError: If the questions don't meet requirements
+    """
+    if not isinstance(questions_data, list):
+        raise ValueError("questions_json must be a JSON array of question objects")
+
+    if not 1 <= len(questions_data) <= _MAX_QUESTIONS:
+        raise ValueError(
+            f"Must ask 1-{_MAX_QUESTIONS} questions, got {len(questions_data)}"
+        )
+
+    # Validate questions in place; the normalized dicts are already the
+    # output shape, so no Question/QuestionOption objects are built
+    questions: List[Dict[str, Any]] = []
+    for idx, q_data in enumerate(questions_data):
+        try:
+            # Read required fields in one pass; a missing key raises KeyError
+            try:
+                text, header, options_data, multi_select = (
+                    q_data["question"],
+                    q_data["header"],
+                    q_data["options"],
+                    q_data["multiSelect"],
+                )
+            except KeyError as e:
+                raise ValueError(f"Question {idx} missing field {e}") from e
+
+            # Parse options
+            options = [_make_option(opt_data, idx) for opt_data in options_data]
+
+            if not isinstance(multi_select, bool):
+                raise ValueError("multiSelect must be a boolean")
+            _check_question(text, header, len(options))
+            questions.append(
+                {
+                    "question": text,
+                    "header": header,
+                    "options": options,
+                    "multiSelect": multi_select,
+                }
+            )
+
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
+            raise ValueError(f"Error parsing question {idx}: {e}") from e
+
+    return tuple(questions)
+
+
+def _await_answers(questions: Tuple[Dict[str, Any], ...]) -> str:
+    """Build the response for the initial call, before the user has answered."""
+    logger.info("Waiting for user to answer {} question(s)", len(questions))
+    return _emit_prompt(questions)
+
+
+def _collect_answers(
+    questions: Tuple[Dict[str, Any], ...], answers_data: Dict[str, Any]
+) -> str:
+    """Build the completed response, mapping answers to question headers."""
+    answer_keys = [f"question_{idx}" for idx in range(len(questions))]
+    result = {
+        "answers": {
+            question["header"]: _as_list(answers_data.get(key))
+            for key, question in zip(answer_keys, questions)
+        },
+        "questions_asked": len(questions),
+        "status": "completed",
+    }
+
+    missing = [
+        question["header"]
+        for key, question in zip(answer_keys, questions)
+        if key not in answers_data
+    ]
+    if missing:
+        logger.warning("No answer provided for question(s): {}", missing)
+
+    logger.opt(lazy=True).info(
+        "User answered {} question(s): {}",
+        lambda: len(questions),
+        lambda: result["answers"],
+    )
+    return _dumps(result)
+
+
+def _failed(e: Exception) -> str:
+    """Log a tool failure and build the failed response."""
+    logger.error(f"AskUserQuestion tool failed: {e}", exc_info=True)
+    return _dumps({"error": str(e), "status": "failed"})
+
+
+def ask_user_question(
+    questions_json: str,
+    user_answers: Optional[str] = None,
+) -> str:
     """
     Ask the user interactive questions with single or multiple choice options.
 
@@ -144,105 +354,50 @@ def ask_user_question(questions_json: str, user_answers: Optional[str] = None) -
         ... )
     """
     try:
-        # Parse the questions JSON
-        try:
-            questions_data = json.loads(questions_json)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid questions_json format: {e}")
-
-        if not isinstance(questions_data, list):
-            raise ValueError("questions_json must be a JSON array of question objects")
-
-        if not 1 <= len(questions_data) <= 4:
-            raise ValueError(f"Must ask 1-4 questions, got {len(questions_data)}")
-
-        # Validate and parse questions
-        questions: List[Question] = []
-        for idx, q_data in enumerate(questions_data):
-            try:
-                # Validate required fields
-                if not all(
-                    k in q_data
-                    for k in ["question", "header", "options", "multiSelect"]
-                ):
-                    raise ValueError(f"Question {idx} missing required fields")
-
-                # Parse options
-                options = []
-                for opt_data in q_data["options"]:
-                    if not all(k in opt_data for k in ["label", "description"]):
-                        raise ValueError(
-                            f"Option in question {idx} missing 'label' or 'description'"
-                        )
-                    options.append(
-                        QuestionOption(
-                            label=opt_data["label"], description=opt_data["description"]
-                        )
-                    )
-
-                # Create question object
-                question = Question(
-                    question=q_data["question"],
-                    header=q_data["header"],
-                    options=options,
-                    multi_select=q_data["multiSelect"],
-                )
-                questions.append(question)
-
-            except Exception as e:
-                raise ValueError(f"Error parsing question {idx}: {e}")
+        questions = _parse_questions(questions_json)
 
         # If user_answers is not provided, we're in the initial call
         # The tool will pause here and wait for user input
         if user_answers is None:
-            logger.info(f"Waiting for user to answer {len(questions)} question(s)")
-            # Format questions for display
-            formatted_questions = {
-                "questions": [q.to_dict() for q in questions],
-                "total_questions": len(questions),
-                "status": "awaiting_user_input",
-            }
-            return json.dumps(formatted_questions, ensure_ascii=False, indent=2)
+            return _await_answers(questions)
 
         # Parse user answers
         try:
-            answers_data = (
-                json.loads(user_answers)
-                if isinstance(user_answers, str)
-                else user_answers
-            )
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid user_answers format: {e}")
-
-        # Build response with answers mapped by header
-        result = {
-            "answers": {},
-            "questions_asked": len(questions),
-            "status": "completed",
-        }
+            answers_data = _loads(user_answers)
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Invalid user_answers format: {e}") from e
+
+        return _collect_answers(questions, answers_data)
+
+    except Exception as e:
+        return _failed(e)
+
+
+def ask_user_question_dict(
+    questions: List[Dict[str, Any]],
+    answers: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Variant of :func:`ask_user_question` for already decoded inputs.
 
-        for idx, question in enumerate(questions):
-            question_key = f"question_{idx}"
-            header = question.header
+    Callers holding Python objects use this entry point to skip the
+    serialize/parse round trip; the questions are validated the same way.
 
-            if question_key in answers_data:
-                user_selection = answers_data[question_key]
-                # Ensure it's a list
-                if not isinstance(user_selection, list):
-                    user_selection = [user_selection]
-                result["answers"][header] = user_selection
-            else:
-                logger.warning(f"No answer provided for question: {header}")
-                result["answers"][header] = []
+    Args:
+        questions: List of question objects (same shape as ``questions_json``)
+        answers: Mapping of ``question_<idx>`` to the selected label(s)
 
-        logger.info(f"User answered {len(questions)} question(s): {result['answers']}")
-        return json.dumps(result, ensure_ascii=False, indent=2)
+    Returns:
+        JSON string in the same format as :func:`ask_user_question`
+    """
+    try:
+        validated = _validate_questions(questions)
+        if answers is None:
+            return _await_answers(validated)
+        return _collect_answers(validated, answers)
 
     except Exception as e:
-        logger.error(f"AskUserQuestion tool failed: {e}", exc_info=True)
-        return json.dumps(
-            {"error": str(e), "status": "failed"}, ensure_ascii=False, indent=2
-        )
+        return _failed(e)
 
 
 # Convenience function for creating questions programmatically
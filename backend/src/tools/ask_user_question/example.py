@@ -14,13 +14,105 @@ from agno.utils import pprint
 from rich.console import Console
 from rich.prompt import Prompt
 
-from src.tools.ask_user_question import ask_user_question, create_question
+from src.tools.ask_user_question import (
+    ask_user_question,
+    ask_user_question_dict,
+    create_question,
+)
 from src.tools.user_control_flow import collect_user_feedback_tool
-from src.config.model_config import qwen_model_config
+from src.config.model_config import QWEN_ROLE_MAP, qwen_model_config
 
 
 console = Console()
 
+# Example questions, built once at import and shared by the examples
+FRAMEWORK_Q = create_question(
+    question="Which web framework should we use for this project?",
+    header="Framework",
+    options=[
+        {
+            "label": "FastAPI",
+            "description": "Modern, fast, based on Python type hints",
+        },
+        {"label": "Flask", "description": "Lightweight, flexible, minimal"},
+        {"label": "Django", "description": "Batteries-included, full-featured"},
+    ],
+    multi_select=False,
+)
+
+AUTH_Q = create_question(
+    question="Which authentication method should we use?",
+    header="Auth method",
+    options=[
+        {
+            "label": "JWT",
+            "description": "JSON Web Tokens - stateless, good for APIs",
+        },
+        {
+            "label": "OAuth 2.0",
+            "description": "Industry standard, supports third-party login",
+        },
+        {
+            "label": "Session",
+            "description": "Traditional cookies, simpler but requires server state",
+        },
+    ],
+    multi_select=False,
+)
+
+FEATURES_Q = create_question(
+    question="Which features do you want to enable?",
+    header="Features",
+    options=[
+        {
+            "label": "Dark mode",
+            "description": "Toggle between light and dark themes",
+        },
+        {
+            "label": "Analytics",
+            "description": "Track user behavior and metrics",
+        },
+        {"label": "i18n", "description": "Internationalization support"},
+    ],
+    multi_select=True,  # Allow multiple selections
+)
+
+DATABASE_Q = create_question(
+    question="Which database should we use?",
+    header="Database",
+    options=[
+        {
+            "label": "PostgreSQL",
+            "description": "Powerful, open source relational database",
+        },
+        {"label": "MongoDB", "description": "NoSQL document database"},
+        {"label": "SQLite", "description": "Lightweight, serverless database"},
+    ],
+    multi_select=False,
+)
+
+PROJECT_FEATURES_Q = create_question(
+    question="Which features do you want to enable?",
+    header="Features",
+    options=[
+        {
+            "label": "Authentication",
+            "description": "User login and authentication",
+        },
+        {"label": "API", "description": "RESTful API endpoints"},
+        {"label": "Admin Panel", "description": "Administrative interface"},
+    ],
+    multi_select=True,
+)
+
+# Serialized question lists, encoded once and reused by the prompt and answer calls
+FRAMEWORK_Q_JSON = json.dumps([FRAMEWORK_Q])
+AUTH_FEATURES_Q_JSON = json.dumps([AUTH_Q, FEATURES_Q])
+PROJECT_Q_JSON = json.dumps([FRAMEWORK_Q, DATABASE_Q, PROJECT_FEATURES_Q])
+
+# Prompt choices for a single-choice question, keyed by its option count (2-4)
+_CHOICES = {n: [str(i) for i in range(1, n + 1)] for n in range(2, 5)}
+
 
 def example_single_question():
     """Example 1: Ask a single question to the user."""
@@ -44,26 +136,12 @@ def example_single_question():
         markdown=True,
     )
 
-    # Create a question about framework choice
-    questions = [
-        create_question(
-            question="Which web framework should we use for this project?",
-            header="Framework",
-            options=[
-                {
-                    "label": "FastAPI",
-                    "description": "Modern, fast, based on Python type hints",
-                },
-                {"label": "Flask", "description": "Lightweight, flexible, minimal"},
-                {"label": "Django", "description": "Batteries-included, full-featured"},
-            ],
-            multi_select=False,
-        )
-    ]
+    # Ask about the framework choice
+    questions_json = FRAMEWORK_Q_JSON
 
     # Simulate the agent calling the tool
     console.print("[yellow]Agent is asking a question...[/]\n")
-    result = ask_user_question(questions_json=json.dumps(questions))
+    result = ask_user_question(questions_json)
     result_data = json.loads(result)
 
     console.print(f"Status: {result_data['status']}")
@@ -77,12 +155,10 @@ def example_single_question():
         "\nYour choice", choices=["FastAPI", "Flask", "Django"], default="FastAPI"
     )
 
-    user_answers = json.dumps({"question_0": [user_choice]})
+    user_answers = {"question_0": [user_choice]}
 
     # Get final result
-    final_result = ask_user_question(
-        questions_json=json.dumps(questions), user_answers=user_answers
-    )
+    final_result = ask_user_question(questions_json, json.dumps(user_answers))
     final_data = json.loads(final_result)
 
     console.print("\n[green]User answered:[/]")
@@ -93,46 +169,10 @@ def example_multiple_questions():
     """Example 2: Ask multiple questions at once."""
     console.print("\n[bold cyan]Example 2: Multiple Questions[/]\n")
 
-    questions = [
-        create_question(
-            question="Which authentication method should we use?",
-            header="Auth method",
-            options=[
-                {
-                    "label": "JWT",
-                    "description": "JSON Web Tokens - stateless, good for APIs",
-                },
-                {
-                    "label": "OAuth 2.0",
-                    "description": "Industry standard, supports third-party login",
-                },
-                {
-                    "label": "Session",
-                    "description": "Traditional cookies, simpler but requires server state",
-                },
-            ],
-            multi_select=False,
-        ),
-        create_question(
-            question="Which features do you want to enable?",
-            header="Features",
-            options=[
-                {
-                    "label": "Dark mode",
-                    "description": "Toggle between light and dark themes",
-                },
-                {
-                    "label": "Analytics",
-                    "description": "Track user behavior and metrics",
-                },
-                {"label": "i18n", "description": "Internationalization support"},
-            ],
-            multi_select=True,  # Allow multiple selections
-        ),
-    ]
+    questions_json = AUTH_FEATURES_Q_JSON
 
     # Initial call - tool waits for user input
-    result = ask_user_question(questions_json=json.dumps(questions))
+    result = ask_user_question(questions_json)
     result_data = json.loads(result)
 
     console.print("[yellow]Agent is asking multiple questions...[/]\n")
@@ -149,22 +189,25 @@ def example_multiple_questions():
         console.print()
 
     # Simulate user answers
-    user_answers = json.dumps(
-        {
-            "question_0": ["JWT"],
-            "question_1": ["Dark mode", "Analytics"],  # Multiple selections
-        }
-    )
+    user_answers = {
+        "question_0": ["JWT"],
+        "question_1": ["Dark mode", "Analytics"],  # Multiple selections
+    }
 
     # Get final result
-    final_result = ask_user_question(
-        questions_json=json.dumps(questions), user_answers=user_answers
-    )
+    final_result = ask_user_question(questions_json, json.dumps(user_answers))
     final_data = json.loads(final_result)
 
     console.print("[green]User answers:[/]")
-    for header, answer in final_data["answers"].items():
-        console.print(f"{header}: {', '.join(answer)}")
+    # Answers are user-provided text: print them in one pass, without markup
+    console.print(
+        "\n".join(
+            f"{header}: {', '.join(answer)}"
+            for header, answer in final_data["answers"].items()
+        ),
+        highlight=False,
+        markup=False,
+    )
 
 
 def example_with_agent_run(auto_mode=False):
@@ -185,52 +228,12 @@ def example_with_agent_run(auto_mode=False):
     # For this example, we'll demonstrate the HITL pattern manually
     # by calling the ask_user_question tool directly
 
-    # Step 1: Create questions
-    questions = [
-        create_question(
-            question="Which web framework should we use for this project?",
-            header="Framework",
-            options=[
-                {
-                    "label": "FastAPI",
-                    "description": "Modern, fast, based on Python type hints",
-                },
-                {"label": "Flask", "description": "Lightweight, flexible, minimal"},
-                {"label": "Django", "description": "Batteries-included, full-featured"},
-            ],
-            multi_select=False,
-        ),
-        create_question(
-            question="Which database should we use?",
-            header="Database",
-            options=[
-                {
-                    "label": "PostgreSQL",
-                    "description": "Powerful, open source relational database",
-                },
-                {"label": "MongoDB", "description": "NoSQL document database"},
-                {"label": "SQLite", "description": "Lightweight, serverless database"},
-            ],
-            multi_select=False,
-        ),
-        create_question(
-            question="Which features do you want to enable?",
-            header="Features",
-            options=[
-                {
-                    "label": "Authentication",
-                    "description": "User login and authentication",
-                },
-                {"label": "API", "description": "RESTful API endpoints"},
-                {"label": "Admin Panel", "description": "Administrative interface"},
-            ],
-            multi_select=True,
-        ),
-    ]
+    # Step 1: Pick the pre-serialized questions
+    questions_json = PROJECT_Q_JSON
 
     # Step 2: Initial call to get the questions formatted
     console.print("[yellow]Agent is asking questions...[/]\n")
-    initial_result = ask_user_question(questions_json=json.dumps(questions))
+    initial_result = ask_user_question(questions_json)
     initial_data = json.loads(initial_result)
 
     # Step 3: Display questions and collect user answers
@@ -295,7 +298,7 @@ def example_with_agent_run(auto_mode=False):
                     else:
                         user_input = Prompt.ask(
                             "\nYour choice (enter option number)",
-                            choices=[str(i) for i in range(1, len(q["options"]) + 1)],
+                            choices=_CHOICES[len(q["options"])],
                             default="1",
                         )
                         choice_idx = int(user_input) - 1
@@ -326,15 +329,19 @@ def example_with_agent_run(auto_mode=False):
 
     # Step 4: Call tool again with user answers
     console.print("\n[yellow]Processing your answers...[/]\n")
-    final_result = ask_user_question(
-        questions_json=json.dumps(questions), user_answers=json.dumps(user_answers)
-    )
+    final_result = ask_user_question(questions_json, json.dumps(user_answers))
     final_data = json.loads(final_result)
 
     # Step 5: Display results
     console.print("[green]✓ Your selections:[/]")
-    for header, answer in final_data["answers"].items():
-        console.print(f"  {header}: {', '.join(answer)}")
+    console.print(
+        "\n".join(
+            f"  {header}: {', '.join(answer)}"
+            for header, answer in final_data["answers"].items()
+        ),
+        highlight=False,
+        markup=False,
+    )
 
     console.print("\n[green]✓ HITL interaction completed successfully![/]")
     console.print(
@@ -362,7 +369,7 @@ def example_error_handling():
             # Missing required fields
         }
     ]
-    result = ask_user_question(questions_json=json.dumps(invalid_questions))
+    result = ask_user_question_dict(invalid_questions)
     result_data = json.loads(result)
     console.print(f"Status: {result_data['status']}")
     console.print(f"Error: {result_data.get('error', 'N/A')}\n")
@@ -378,13 +385,7 @@ def example_dynamic_user_input():
         base_url=qwen_model_config.base_url,
     )
     # 为通义千问API修正角色映射
-    model.default_role_map = {
-        "system": "system",
-        "user": "user",
-        "assistant": "assistant",
-        "tool": "tool",
-        "model": "assistant",
-    }
+    model.default_role_map = QWEN_ROLE_MAP
 
     agent = Agent(
         name="DynamicInputAgent",
@@ -0,0 +1,42 @@
+"""
+msgspec schema for AskUserQuestion payloads.
+
+The structs only generate the JSON Schema given to the model. Payloads are
+validated by the core implementation, which reads the limits defined here.
+"""
+
+from typing import Annotated, List
+
+import msgspec
+
+MAX_HEADER_LENGTH = 12
+MIN_OPTIONS, MAX_OPTIONS = 2, 4
+MAX_QUESTIONS = 4
+
+
+class QuestionOptionSchema(msgspec.Struct):
+    """Schema of a single question option."""
+
+    label: str
+    description: str
+
+
+class QuestionSchema(msgspec.Struct):
+    """Schema of a single question."""
+
+    question: str
+    header: Annotated[str, msgspec.Meta(max_length=MAX_HEADER_LENGTH)]
+    options: Annotated[
+        List[QuestionOptionSchema],
+        msgspec.Meta(min_length=MIN_OPTIONS, max_length=MAX_OPTIONS),
+    ]
+    multi_select: bool = msgspec.field(name="multiSelect")
+
+
+QuestionList = Annotated[
+    List[QuestionSchema], msgspec.Meta(min_length=1, max_length=MAX_QUESTIONS)
+]
+
+# JSON Schema of the payload, given to the model as the tool's format spec
+QUESTIONS_JSON_SCHEMA = msgspec.json.encode(msgspec.json.schema(QuestionList)).decode()
+
@@ -1,15 +1,15 @@
 """Tavily web search tool integration."""
 
-from .core import create_tavily_tool
-import os
-
-# Create default tool instance (only if API key is available)
-tavily_tool = None
-if os.getenv("TAVILY_API_KEY"):
-    try:
-        tavily_tool = create_tavily_tool()
-    except Exception:
-        # API key might be invalid, let users configure manually
-        pass
-
-__all__ = ["tavily_tool", "create_tavily_tool"]
+from typing import Any
+
+from .core import create_tavily_tool, default_tavily_tool
+
+__all__ = ["tavily_tool", "create_tavily_tool", "default_tavily_tool"]
+
+
+def __getattr__(name: str) -> Any:
+    """Create the default ``tavily_tool`` on first access (only if API key is available)."""
+    if name != "tavily_tool":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # default_tavily_tool shares one instance through create_tavily_tool's cache
+    return default_tavily_tool()
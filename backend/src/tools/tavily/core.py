@@ -1,12 +1,15 @@
 """Tavily search tool core implementation."""
 
-from agno.tools.tavily import TavilyTools
-from typing import Literal
+from typing import TYPE_CHECKING, Literal, Optional
+import functools
 import os
 
-import dotenv
+if TYPE_CHECKING:
+    from agno.tools.tavily import TavilyTools
+
+# Read once at import; backend/.env is loaded by the src package beforehand
+_DEFAULT_TAVILY_KEY = os.environ.get("TAVILY_API_KEY", "")
 
-dotenv.load_dotenv()
 
 def create_tavily_tool(
     api_key: str | None = None,
@@ -15,7 +18,7 @@ def create_tavily_tool(
     max_tokens: int = 8000,
     search_depth: Literal["basic", "advanced"] = "advanced",
     format: Literal["json", "markdown"] = "json",
-) -> TavilyTools:
+) -> "TavilyTools":
     """
     Create and configure Tavily search tool instance.
 
@@ -27,7 +30,7 @@ def create_tavily_tool(
         format: Result format ("json" or "markdown")
 
     Returns:
-        Configured TavilyTools instance
+        Configured TavilyTools instance, shared by calls with the same arguments
 
     Raises:
         ValueError: If API key is not provided and not found in environment
@@ -38,9 +41,7 @@ def create_tavily_tool(
         >>> agent = Agent(tools=[tool])
     """
     if api_key is None:
-        api_key = os.getenv("TAVILY_API_KEY", "")
-    
-    print(f"Using Tavily API Key: {api_key}")  # Debugging line
+        api_key = _DEFAULT_TAVILY_KEY
 
     if not api_key:
         raise ValueError(
@@ -48,6 +49,41 @@ def create_tavily_tool(
             "TAVILY_API_KEY environment variable."
         )
 
+    return _build_tavily_tool(
+        api_key, enable_search, include_answer, max_tokens, search_depth, format
+    )
+
+
+def default_tavily_tool() -> Optional["TavilyTools"]:
+    """
+    Return the default Tavily tool built from TAVILY_API_KEY.
+
+    Returns:
+        The shared TavilyTools instance, or None if no API key is configured
+        or the tool cannot be created
+    """
+    if not _DEFAULT_TAVILY_KEY:
+        return None
+    try:
+        return create_tavily_tool()
+    except Exception:
+        # API key might be invalid, let users configure manually
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _build_tavily_tool(
+    api_key: str,
+    enable_search: bool,
+    include_answer: bool,
+    max_tokens: int,
+    search_depth: Literal["basic", "advanced"],
+    format: Literal["json", "markdown"],
+) -> "TavilyTools":
+    """Build a TavilyTools instance, cached per argument tuple."""
+    # Imported here so the tavily SDK is only loaded when a tool is built
+    from agno.tools.tavily import TavilyTools
+
     return TavilyTools(
         api_key=api_key,
         enable_search=enable_search,
@@ -8,11 +8,40 @@ when needed during execution.
 Reference: https://docs.agno.com/concepts/hitl/overview
 """
 
-import json
+import functools
 from typing import Optional
 
+import orjson
 from agno.tools import tool
 
+# Response envelopes; only the JSON-escaped variable strings are substituted
+# Responses stay str: agno passes tool results through str(), so bytes would
+# reach the model as "b'...'"
+_AWAITING_TEMPLATE = (
+    '{"status":"awaiting_input","prompt":%s,'
+    '"message":"Pausing execution to collect user feedback"}'
+)
+_COMPLETED_TEMPLATE = '{"status":"completed","feedback":%s,"message":%s}'
+
+
+def _json_str(value: str) -> str:
+    """Encode a string as a JSON string literal."""
+    return orjson.dumps(value).decode()
+
+
+@functools.lru_cache(maxsize=256)
+def _awaiting(prompt: str) -> str:
+    """Build the awaiting-input response; retried prompts reuse the result."""
+    return _AWAITING_TEMPLATE % _json_str(prompt)
+
+
+def _completed(feedback: str) -> str:
+    """Build the completed response; not cached, since feedback is user data."""
+    return _COMPLETED_TEMPLATE % (
+        _json_str(feedback),
+        _json_str(f"User provided feedback: {feedback}"),
+    )
+
 
 # Create the tool function with @tool decorator
 @tool(
@@ -53,19 +82,7 @@ def collect_user_feedback_tool(prompt: str, feedback: Optional[str] = None) -> s
     """
     if feedback is None:
         # Waiting for user input
-        return json.dumps(
-            {
-                "status": "awaiting_input",
-                "prompt": prompt,
-                "message": "Pausing execution to collect user feedback",
-            }
-        )
+        return _awaiting(prompt)
 
     # User has provided feedback
-    return json.dumps(
-        {
-            "status": "completed",
-            "feedback": feedback,
-            "message": f"User provided feedback: {feedback}",
-        }
-    )
+    return _completed(feedback)
@@ -0,0 +1,52 @@
+"""
+Shared pytest fixtures.
+"""
+
+import os
+
+import pytest
+
+# Tests marked "live" call the real model and search APIs (billed), so they
+# only run when explicitly enabled, even if backend/.env provides API keys
+LIVE_TESTS = os.getenv("AGENT_UI_LIVE_TESTS", "").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip live API tests unless AGENT_UI_LIVE_TESTS is set."""
+    if LIVE_TESTS:
+        return
+    skip_live = pytest.mark.skip(reason="set AGENT_UI_LIVE_TESTS=1 to call live APIs")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+def _require_model_key():
+    """Skip live agent tests when no model API key is configured."""
+    from src.config.model_config import qwen_model_config
+
+    if not qwen_model_config.api_key:
+        pytest.skip("DASHSCOPE_API_KEY is not configured")
+
+
+@pytest.fixture(scope="session")
+def chat_agent():
+    """The chat agent, imported on first use."""
+    _require_model_key()
+    from src.agents.chat_agent import chat_agent as agent
+
+    return agent
+
+
+@pytest.fixture(scope="session")
+def search_agent():
+    """The search agent, imported on first use."""
+    _require_model_key()
+    from src.agents.search_agent import search_agent as agent
+
+    return agent
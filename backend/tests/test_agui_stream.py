@@ -0,0 +1,150 @@
+"""
+Tests for the buffered AG-UI event stream.
+"""
+
+import asyncio
+
+from ag_ui.core import (
+    EventType,
+    TextMessageContentEvent,
+    TextMessageEndEvent,
+    TextMessageStartEvent,
+)
+
+from src.interfaces.agui import (
+    MAX_QUEUED_EVENTS,
+    coalesce_text_events,
+    encode_in_batches,
+)
+
+
+def _delta(text, message_id="m1"):
+    return TextMessageContentEvent(
+        type=EventType.TEXT_MESSAGE_CONTENT, message_id=message_id, delta=text
+    )
+
+
+def _collect(events, delay=0.0):
+    async def source():
+        for event in events:
+            if delay:
+                await asyncio.sleep(delay)
+            yield event
+
+    async def run():
+        return [event async for event in coalesce_text_events(source())]
+
+    return asyncio.run(run())
+
+
+class TestCoalesceTextEvents:
+    """Test the coalesce_text_events stream transformer."""
+
+    def test_first_delta_is_sent_immediately(self):
+        """Test that the first delta of a message is not delayed."""
+        result = _collect([_delta("Hello"), _delta(" there"), _delta(" friend")])
+        assert result[0].delta == "Hello"
+
+    def test_deltas_are_merged(self):
+        """Test that deltas after the first one are batched."""
+        deltas = ["Hi", " a", " b", " c", " d", " e", " f"]
+        result = _collect([_delta(d) for d in deltas])
+        assert [e.delta for e in result] == ["Hi", " a b c", " d e f"]
+
+    def test_sentence_end_flushes(self):
+        """Test that a sentence boundary flushes the buffer."""
+        result = _collect([_delta("Hi"), _delta(" there."), _delta(" More")])
+        assert [e.delta for e in result] == ["Hi", " there.", " More"]
+
+    def test_other_events_keep_order(self):
+        """Test that non-text events flush pending text and keep their order."""
+        start = TextMessageStartEvent(
+            type=EventType.TEXT_MESSAGE_START, message_id="m1", role="assistant"
+        )
+        end = TextMessageEndEvent(type=EventType.TEXT_MESSAGE_END, message_id="m1")
+        result = _collect([start, _delta("Hi"), _delta(" a"), _delta(" b"), end])
+        assert [e.type for e in result] == [
+            EventType.TEXT_MESSAGE_START,
+            EventType.TEXT_MESSAGE_CONTENT,
+            EventType.TEXT_MESSAGE_CONTENT,
+            EventType.TEXT_MESSAGE_END,
+        ]
+        assert "".join(e.delta for e in result[1:3]) == "Hi a b"
+
+    def test_messages_are_not_merged(self):
+        """Test that deltas of different messages stay separate."""
+        result = _collect(
+            [_delta("A", "m1"), _delta(" b", "m1"), _delta("C", "m2")]
+        )
+        assert [(e.message_id, e.delta) for e in result] == [
+            ("m1", "A"),
+            ("m1", " b"),
+            ("m2", "C"),
+        ]
+
+    def test_timer_flushes_slow_streams(self):
+        """Test that buffered text is flushed when the stream stalls."""
+        result = _collect([_delta("Hi"), _delta(" a"), _delta(" b")], delay=0.06)
+        assert [e.delta for e in result] == ["Hi", " a", " b"]
+
+
+def _encode_all(events, max_batch=32, fail=False):
+    async def source():
+        for event in events:
+            yield event
+        if fail:
+            raise RuntimeError("boom")
+
+    async def run():
+        chunks = []
+        try:
+            async for chunk in encode_in_batches(
+                source(), lambda e: f"data: {e.delta}\n\n", max_batch
+            ):
+                chunks.append(chunk)
+        except RuntimeError:
+            chunks.append("error")
+        return chunks
+
+    return asyncio.run(run())
+
+
+class TestEncodeInBatches:
+    """Test joining ready SSE frames into one chunk."""
+
+    def test_ready_frames_are_joined(self):
+        """Test that queued frames are sent together, capped at max_batch."""
+        chunks = _encode_all([_delta(str(i)) for i in range(5)], max_batch=2)
+        assert chunks == [
+            "data: 0\n\ndata: 1\n\n",
+            "data: 2\n\ndata: 3\n\n",
+            "data: 4\n\n",
+        ]
+
+    def test_error_is_raised_after_pending_frames(self):
+        """Test that frames before a failure are still sent."""
+        chunks = _encode_all([_delta("a"), _delta("b")], fail=True)
+        assert "".join(chunks[:-1]) == "data: a\n\ndata: b\n\n"
+        assert chunks[-1] == "error"
+
+
+def test_slow_consumer_throttles_producer():
+    """Test that the producer stays at most a bounded queue ahead of the client."""
+    produced = 0
+
+    async def source():
+        nonlocal produced
+        for i in range(10 * MAX_QUEUED_EVENTS):
+            produced += 1
+            yield _delta(f"{i}.")
+
+    async def run():
+        stream = coalesce_text_events(source())
+        await stream.__anext__()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        ahead = produced
+        await stream.aclose()
+        return ahead
+
+    assert asyncio.run(run()) <= MAX_QUEUED_EVENTS + 2
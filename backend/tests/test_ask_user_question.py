@@ -2,14 +2,66 @@
 Tests for the AskUserQuestion tool.
 """
 
-import json
+import orjson
 import pytest
 from src.tools.ask_user_question import (
     ask_user_question,
+    ask_user_question_tool,
+    ask_user_question_dict,
     create_question,
     QuestionOption,
     Question
 )
+from src.tools.ask_user_question.core import _decode_questions, _parse_questions
+from src.tools.ask_user_question.schema import QUESTIONS_JSON_SCHEMA
+
+
+def _json(obj):
+    """Serialize test input to the JSON text the tool receives."""
+    return orjson.dumps(obj).decode()
+
+
+# Static payloads shared across tests, built once at import
+_FRAMEWORK_QUESTIONS = [
+    create_question(
+        question="Which framework?",
+        header="Framework",
+        options=[
+            {"label": "React", "description": "UI library"},
+            {"label": "Vue", "description": "Framework"}
+        ]
+    )
+]
+_FRAMEWORK_QUESTIONS_JSON = _json(_FRAMEWORK_QUESTIONS)
+
+_FEATURES_QUESTIONS = [
+    create_question(
+        question="Which features do you want?",
+        header="Features",
+        options=[
+            {"label": "Dark mode", "description": "Theme toggle"},
+            {"label": "Analytics", "description": "Track metrics"},
+            {"label": "i18n", "description": "Internationalization"}
+        ],
+        multi_select=True
+    )
+]
+_FEATURES_QUESTIONS_JSON = _json(_FEATURES_QUESTIONS)
+
+_FRAMEWORK_FEATURES_QUESTIONS_JSON = _json(
+    _FRAMEWORK_QUESTIONS + _FEATURES_QUESTIONS
+)
+
+_TOO_MANY_QUESTIONS_JSON = _json([
+    create_question(
+        question=f"Question {i}?",
+        header=f"Q{i}",
+        options=[
+            {"label": "A", "description": "First"},
+            {"label": "B", "description": "Second"}
+        ]
+    ) for i in range(5)
+])
 
 
 class TestQuestionOption:
@@ -145,11 +197,11 @@ class TestAskUserQuestionTool:
                 ]
             )
         ]
-        questions_json = json.dumps(questions)
+        questions_json = _json(questions)
 
         # Call the main function directly
         result = ask_user_question(questions_json=questions_json)
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["status"] == "awaiting_user_input"
         assert result_data["total_questions"] == 1
@@ -177,139 +229,66 @@ class TestAskUserQuestionTool:
                 multi_select=False
             )
         ]
-        questions_json = json.dumps(questions)
+        questions_json = _json(questions)
 
         result = ask_user_question(questions_json=questions_json)
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["status"] == "awaiting_user_input"
         assert result_data["total_questions"] == 2
         assert len(result_data["questions"]) == 2
 
-    def test_with_user_answers_single_choice(self):
-        """Test tool with user answers for single choice."""
-        questions = [
-            create_question(
-                question="Which framework?",
-                header="Framework",
-                options=[
-                    {"label": "React", "description": "UI library"},
-                    {"label": "Vue", "description": "Framework"}
-                ]
-            )
-        ]
-        questions_json = json.dumps(questions)
-        user_answers = json.dumps({
-            "question_0": ["React"]
-        })
-
-        result = ask_user_question(
-            questions_json=questions_json,
-            user_answers=user_answers
-        )
-        result_data = json.loads(result)
-
-        assert result_data["status"] == "completed"
-        assert result_data["questions_asked"] == 1
-        assert result_data["answers"]["Framework"] == ["React"]
-
-    def test_with_user_answers_multiple_choice(self):
-        """Test tool with user answers for multiple choice."""
-        questions = [
-            create_question(
-                question="Which features do you want?",
-                header="Features",
-                options=[
-                    {"label": "Dark mode", "description": "Theme toggle"},
-                    {"label": "Analytics", "description": "Track metrics"},
-                    {"label": "i18n", "description": "Internationalization"}
-                ],
-                multi_select=True
-            )
-        ]
-        questions_json = json.dumps(questions)
-        user_answers = json.dumps({
-            "question_0": ["Dark mode", "Analytics"]
-        })
-
-        result = ask_user_question(
-            questions_json=questions_json,
-            user_answers=user_answers
-        )
-        result_data = json.loads(result)
-
-        assert result_data["status"] == "completed"
-        assert result_data["questions_asked"] == 1
-        assert "Dark mode" in result_data["answers"]["Features"]
-        assert "Analytics" in result_data["answers"]["Features"]
-        assert len(result_data["answers"]["Features"]) == 2
-
-    def test_with_multiple_questions_and_answers(self):
-        """Test tool with multiple questions and answers."""
-        questions = [
-            create_question(
-                question="Which framework?",
-                header="Framework",
-                options=[
-                    {"label": "React", "description": "UI library"},
-                    {"label": "Vue", "description": "Framework"}
-                ]
+    @pytest.mark.parametrize(
+        ("questions_json", "user_answers", "expected_answers"),
+        [
+            (
+                _FRAMEWORK_QUESTIONS_JSON,
+                {"question_0": ["React"]},
+                {"Framework": ["React"]},
             ),
-            create_question(
-                question="Which features?",
-                header="Features",
-                options=[
-                    {"label": "Auth", "description": "Authentication"},
-                    {"label": "DB", "description": "Database"}
-                ],
-                multi_select=True
-            )
-        ]
-        questions_json = json.dumps(questions)
-        user_answers = json.dumps({
-            "question_0": ["React"],
-            "question_1": ["Auth", "DB"]
-        })
-
+            (
+                _FEATURES_QUESTIONS_JSON,
+                {"question_0": ["Dark mode", "Analytics"]},
+                {"Features": ["Dark mode", "Analytics"]},
+            ),
+            (
+                _FRAMEWORK_FEATURES_QUESTIONS_JSON,
+                {"question_0": ["React"], "question_1": ["Dark mode", "i18n"]},
+                {"Framework": ["React"], "Features": ["Dark mode", "i18n"]},
+            ),
+        ],
+        ids=["single_choice", "multiple_choice", "multiple_questions"],
+    )
+    def test_with_user_answers(self, questions_json, user_answers, expected_answers):
+        """Test tool with user answers for single and multiple choice."""
         result = ask_user_question(
             questions_json=questions_json,
-            user_answers=user_answers
+            user_answers=_json(user_answers)
         )
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["status"] == "completed"
-        assert result_data["questions_asked"] == 2
-        assert result_data["answers"]["Framework"] == ["React"]
-        assert result_data["answers"]["Features"] == ["Auth", "DB"]
+        assert result_data["questions_asked"] == len(expected_answers)
+        assert result_data["answers"] == expected_answers
 
     def test_invalid_questions_json(self):
         """Test with invalid questions JSON."""
         result = ask_user_question(questions_json="invalid json")
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
         assert result_data["status"] == "failed"
         assert "error" in result_data
 
     def test_questions_not_array(self):
         """Test with questions that's not an array."""
         result = ask_user_question(questions_json='{"not": "array"}')
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
         assert result_data["status"] == "failed"
         assert "error" in result_data
 
     def test_too_many_questions(self):
         """Test with more than 4 questions."""
-        questions = [
-            create_question(
-                question=f"Question {i}?",
-                header=f"Q{i}",
-                options=[
-                    {"label": "A", "description": "First"},
-                    {"label": "B", "description": "Second"}
-                ]
-            ) for i in range(5)
-        ]
-        result = ask_user_question(questions_json=json.dumps(questions))
-        result_data = json.loads(result)
+        result = ask_user_question(questions_json=_TOO_MANY_QUESTIONS_JSON)
+        result_data = orjson.loads(result)
         assert result_data["status"] == "failed"
         assert "1-4 questions" in result_data["error"]
 
@@ -321,8 +300,8 @@ class TestAskUserQuestionTool:
                 # Missing header, options, multiSelect
             }
         ]
-        result = ask_user_question(questions_json=json.dumps(questions))
-        result_data = json.loads(result)
+        result = ask_user_question(questions_json=_json(questions))
+        result_data = orjson.loads(result)
         assert result_data["status"] == "failed"
         assert "error" in result_data
 
@@ -339,11 +318,84 @@ class TestAskUserQuestionTool:
                 ]
             }
         ]
-        result = ask_user_question(questions_json=json.dumps(questions))
-        result_data = json.loads(result)
+        result = ask_user_question(questions_json=_json(questions))
+        result_data = orjson.loads(result)
         assert result_data["status"] == "failed"
         assert "error" in result_data
 
+    def test_invalid_field_types(self):
+        """Test that non-boolean multiSelect and non-string options fail."""
+        question = dict(_FRAMEWORK_QUESTIONS[0], multiSelect="yes")
+        result = orjson.loads(ask_user_question(questions_json=_json([question])))
+        assert result["status"] == "failed"
+        assert "multiSelect" in result["error"]
+
+        question = dict(_FRAMEWORK_QUESTIONS[0], options=[
+            {"label": 1, "description": "One"},
+            {"label": "Two", "description": "Two"}
+        ])
+        result = orjson.loads(ask_user_question(questions_json=_json([question])))
+        assert result["status"] == "failed"
+
+    def test_tool_wrapper_validates_in_core(self):
+        """Test that the agent tool reports validation errors from core."""
+        result = orjson.loads(
+            ask_user_question_tool.entrypoint(questions_json=_TOO_MANY_QUESTIONS_JSON)
+        )
+        assert result["status"] == "failed"
+        assert "1-4 questions" in result["error"]
+
+    def test_answer_call_reuses_parsed_questions(self):
+        """Test that the answer call doesn't parse questions_json again."""
+        questions_json = _json([
+            create_question(
+                question="Which cache test?",
+                header="Cache",
+                options=[
+                    {"label": "A", "description": "First"},
+                    {"label": "B", "description": "Second"}
+                ]
+            )
+        ])
+        ask_user_question(questions_json=questions_json)
+        hits = _decode_questions.cache_info().hits
+        ask_user_question(
+            questions_json=questions_json,
+            user_answers=_json({"question_0": ["A"]})
+        )
+        assert _decode_questions.cache_info().hits == hits + 1
+
+    def test_parsed_questions_are_not_shared(self):
+        """Test that mutating parsed questions doesn't affect later calls."""
+        parsed = _parse_questions(_FRAMEWORK_QUESTIONS_JSON)
+        parsed[0]["header"] = "Changed"
+        parsed[0]["options"].append({"label": "Svelte", "description": "Compiler"})
+
+        fresh = _parse_questions(_FRAMEWORK_QUESTIONS_JSON)
+        assert fresh[0]["header"] == "Framework"
+        assert len(fresh[0]["options"]) == 2
+
+    def test_decoded_inputs(self):
+        """Test the dict entry point, which skips JSON encoding."""
+        questions = _FRAMEWORK_QUESTIONS
+        result_data = orjson.loads(ask_user_question_dict(questions))
+        assert result_data["status"] == "awaiting_user_input"
+
+        result = ask_user_question_dict(questions, {"question_0": ["Vue"]})
+        assert orjson.loads(result)["answers"]["Framework"] == ["Vue"]
+
+
+class TestQuestionsJsonSchema:
+    """Test the JSON Schema generated from the msgspec structs."""
+
+    def test_json_schema(self):
+        """Test that the JSON Schema given to the model mirrors the structs."""
+        schema = orjson.loads(QUESTIONS_JSON_SCHEMA)
+        question = schema["$defs"]["QuestionSchema"]
+        assert schema["maxItems"] == 4
+        assert "multiSelect" in question["required"]
+        assert question["properties"]["header"]["maxLength"] == 12
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
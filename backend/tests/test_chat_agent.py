@@ -1,29 +1,36 @@
-from pathlib import Path
+import os
 import sys
+import pytest
 from agno.models.message import Message
 from typing import Iterator, Any, Union, cast
 from agno.agent import RunOutput, RunOutputEvent, RunEvent
 from agno.utils.pprint import pprint_run_response
 
-sys.path.append(str(Path(__file__).resolve().parent.parent))
-from src.agents.chat_agent import chat_agent
+pytestmark = pytest.mark.live
 
-
-def print_response():
+def test_print_response(chat_agent, capsys):
     print("########## Feature 1: Print Response ##########")
+    capsys.readouterr()
     chat_agent.print_response(
         Message(role="user", content="Hello, Introduce Yourself."), stream=True
     )
+    assert capsys.readouterr().out.strip()
 
 
-def agent_run():
+def test_agent_run(chat_agent):
     print("########## Feature 2: Agent Run ##########")
     
     response: Union[RunOutput, Iterator[Union[RunOutputEvent, RunOutput]]]= chat_agent.run(
         Message(role="user", content="Hello, Introduce Yourself.")
     )
 
-    pprint_run_response(response)
+    # Rich rendering is opt-in (PRETTY=1); otherwise write the raw content
+    if os.environ.get("PRETTY"):
+        pprint_run_response(response)
+    else:
+        sys.stdout.write(f"{response.content or ''}\n")
+
+    assert response.content
 
     # Print the response
     # if isinstance(response, Iterator):
@@ -38,19 +45,24 @@ def agent_run():
     
 
 
-def stream_run():
+def test_stream_run(chat_agent):
     print("########## Feature 3: Stream Run ##########")
     stream: Iterator[RunOutputEvent | RunOutput] = chat_agent.run(Message(role="user", content="Hello, Introduce Yourself."), stream=True)
+    contents = []
     for chunk in stream:
         # 检查 chunk 的类型，处理 RunOutputEvent 和 RunOutput 两种情况
         if isinstance(chunk, RunOutputEvent):
             if chunk.event == RunEvent.run_content:
                 print(chunk.content)
+                contents.append(chunk.content or "")
         elif isinstance(chunk, RunOutput):
             print(chunk.content)
+            contents.append(chunk.content or "")
+
+    assert "".join(contents).strip()
 
 
 if __name__ == "__main__":
-    # print_response()
-    agent_run()
-    # stream_run()
+    os.environ.setdefault("AGENT_UI_LIVE_TESTS", "1")
+    # Select another feature with -k print_response / -k stream_run
+    pytest.main([__file__, "-s", "-k", "agent_run"])
@@ -0,0 +1,237 @@
+"""
+Tests for the in-memory LLM response cache.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponse
+
+from src.cache import LLMResponseCache, SemanticCache, cache_model_responses
+
+
+@pytest.fixture
+def cache():
+    return LLMResponseCache(maxsize=10, ttl=60)
+
+
+class TestLLMResponseCache:
+    """Test LLMResponseCache class."""
+
+    def test_key_is_deterministic(self, cache):
+        """Test that identical requests map to the same key."""
+        model = OpenAIChat(id="qwen-plus", api_key="test")
+        messages = [Message(role="user", content="Hello")]
+        assert cache.make_key(model, messages, stream=False) == cache.make_key(
+            model, [Message(role="user", content="Hello")], stream=False
+        )
+
+    def test_key_depends_on_request(self, cache):
+        """Test that model, messages and stream flag change the key."""
+        model = OpenAIChat(id="qwen-plus", api_key="test")
+        other = OpenAIChat(id="qwen3-max", api_key="test")
+        messages = [Message(role="user", content="Hello")]
+        key = cache.make_key(model, messages, stream=False)
+        assert key != cache.make_key(other, messages, stream=False)
+        assert key != cache.make_key(model, messages, stream=True)
+        assert key != cache.make_key(
+            model, [Message(role="user", content="Hi")], stream=False
+        )
+
+    def test_hit_and_miss_counters(self, cache):
+        """Test hits and misses are counted."""
+        assert cache.get("key") is None
+        cache.save_response("key", ModelResponse(content="cached"))
+        entry = cache.get("key")
+        assert entry["result"]["content"] == "cached"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["size"] == 1
+
+    def test_streaming_responses(self, cache):
+        """Test streaming chunks are stored in order."""
+        cache.save_streaming_responses(
+            "key", [ModelResponse(content="a"), ModelResponse(content="b")]
+        )
+        chunks = cache.get("key")["streaming_responses"]
+        assert [c["content"] for c in chunks] == ["a", "b"]
+
+
+class TestCacheModelResponses:
+    """Test the cache_model_responses helper."""
+
+    def test_deterministic_model_is_cached(self, cache):
+        """Test that a temperature=0 model is routed through the cache."""
+        model = cache_model_responses(
+            OpenAIChat(id="qwen-plus", api_key="test", temperature=0), cache
+        )
+        assert model.cache_response is True
+        assert model._get_cached_model_response("missing") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_sampling_model_is_not_cached(self, cache):
+        """Test that models without temperature=0 are left unchanged."""
+        model = cache_model_responses(
+            OpenAIChat(id="qwen-plus", api_key="test"), cache
+        )
+        assert model.cache_response is False
+
+
+def _fake_embed(text: str) -> np.ndarray:
+    """Embed by keyword so paraphrases share a direction."""
+    vectors = {
+        "news": [1.0, 0.0, 0.0],
+        "weather": [0.0, 1.0, 0.0],
+    }
+    for keyword, vector in vectors.items():
+        if keyword in text:
+            return np.array(vector)
+    return np.array([0.0, 0.0, 1.0])
+
+
+class TestSemanticCache:
+    """Test SemanticCache class and its use as the second cache tier."""
+
+    def test_similar_query_hits(self):
+        """Test that a paraphrase in the same context hits."""
+        semantic = SemanticCache(embed=_fake_embed)
+        semantic.add("ctx", "latest AI news", {"result": "cached"})
+        assert semantic.get("ctx", "recent news about AI") == {"result": "cached"}
+        assert semantic.get("ctx", "weather today") is None
+
+    def test_context_isolation(self):
+        """Test that entries are not shared across contexts."""
+        semantic = SemanticCache(embed=_fake_embed)
+        semantic.add("ctx-a", "latest AI news", {"result": "cached"})
+        assert semantic.get("ctx-b", "latest AI news") is None
+
+    def test_maxsize_evicts_oldest(self):
+        """Test that the oldest entry is evicted past maxsize."""
+        semantic = SemanticCache(embed=_fake_embed, maxsize=1)
+        semantic.add("ctx", "latest AI news", {"result": "old"})
+        semantic.add("ctx", "weather today", {"result": "new"})
+        assert len(semantic) == 1
+        assert semantic.get("ctx", "latest AI news") is None
+
+    def test_dimension_change_then_evict(self):
+        """Test that replacing a context's index drops its old eviction slots."""
+        dims = {"n": 3}
+
+        def embed(text):
+            return np.resize(_fake_embed(text), dims["n"])
+
+        semantic = SemanticCache(embed=embed, maxsize=2)
+        semantic.add("ctx", "latest AI news", {"result": "old"})
+        dims["n"] = 4
+        semantic.add("ctx", "weather today", {"result": "new"})
+        assert len(semantic) == 1
+
+        semantic.add("other", "latest AI news", {"result": "other"})
+        assert semantic.get("ctx", "weather today") == {"result": "new"}
+
+        semantic.add("other", "weather today", {"result": "newest"})
+        assert len(semantic) == 2
+        assert semantic.get("ctx", "weather today") is None
+        assert semantic.get("other", "latest AI news") == {"result": "other"}
+
+    def test_second_tier_lookup(self):
+        """Test that an exact miss falls back to the semantic tier."""
+        cache = LLMResponseCache(semantic=SemanticCache(embed=_fake_embed))
+        model = OpenAIChat(id="qwen-plus", api_key="test")
+        system = Message(role="system", content="You are helpful.")
+
+        key = cache.make_key(
+            model, [system, Message(role="user", content="latest AI news")], False
+        )
+        cache.save_response(key, ModelResponse(content="cached"))
+
+        paraphrase = cache.make_key(
+            model,
+            [system, Message(role="user", content="recent news about AI")],
+            False,
+        )
+        assert paraphrase != key
+        assert cache.get(paraphrase)["result"]["content"] == "cached"
+        assert cache.stats()["semantic_hits"] == 1
+
+        other_context = cache.make_key(
+            model,
+            [
+                Message(role="system", content="Other prompt."),
+                Message(role="user", content="recent news about AI"),
+            ],
+            False,
+        )
+        assert cache.get(other_context) is None
+
+    def test_lookup_in_event_loop_needs_prepared_query(self):
+        """Test that lookups inside the loop never embed inline."""
+        calls = []
+
+        def embed(text):
+            calls.append(text)
+            return _fake_embed(text)
+
+        semantic = SemanticCache(embed=embed)
+        semantic.add("ctx", "latest AI news", {"result": "cached"})
+        calls.clear()
+
+        async def run():
+            assert semantic.get("ctx", "recent news about AI") is None
+            assert calls == []
+            await semantic.prepare("recent news about AI")
+            return semantic.get("ctx", "recent news about AI")
+
+        assert asyncio.run(run()) == {"result": "cached"}
+        assert calls == ["recent news about AI"]
+
+    def test_async_response_prepares_query(self):
+        """Test that the async model path embeds the query before the lookup."""
+        semantic = SemanticCache(embed=_fake_embed)
+        cache = LLMResponseCache(semantic=semantic)
+        model = OpenAIChat(id="qwen-plus", api_key="test", temperature=0)
+        prepared = []
+
+        async def aresponse(messages, **kwargs):
+            prepared.append(messages[-1].content in semantic._prepared)
+            return ModelResponse(content="ok")
+
+        model.aresponse = aresponse
+        cache_model_responses(model, cache)
+        messages = [Message(role="user", content="latest AI news")]
+        result = asyncio.run(model.aresponse(messages=messages))
+        assert result.content == "ok"
+        assert prepared == [True]
+
+
+class TestCacheStatsRoute:
+    """Test the server's /cache/stats route."""
+
+    @pytest.fixture
+    def server(self):
+        from src import server
+
+        return server
+
+    def test_disabled(self, server, monkeypatch):
+        """Test that the route reports a disabled cache."""
+        from fastapi.testclient import TestClient
+
+        monkeypatch.setattr(server, "llm_cache_enabled", False)
+        response = TestClient(server.app).get("/cache/stats")
+        assert response.status_code == 200
+        assert response.json() == {"enabled": False}
+
+    def test_enabled(self, server, monkeypatch):
+        """Test that the route returns the shared cache counters when enabled."""
+        from fastapi.testclient import TestClient
+
+        from src.cache import llm_cache
+
+        monkeypatch.setattr(server, "llm_cache_enabled", True)
+        response = TestClient(server.app).get("/cache/stats")
+        assert response.status_code == 200
+        assert response.json() == {"enabled": True, **llm_cache.stats()}
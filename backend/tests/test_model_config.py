@@ -0,0 +1,91 @@
+"""
+Tests for the model configuration.
+"""
+
+import copy
+import dataclasses
+import json
+import pickle
+
+import orjson
+import pytest
+from loguru import logger
+
+from src.config.base import env_flag
+from src.config.model_config import ModelConfig, _redacted, log_model_configs
+
+
+@pytest.fixture
+def config():
+    return ModelConfig(
+        api_key="sk-test", base_url="https://example.com/v1", model_name="qwen-plus"
+    )
+
+
+class TestModelConfig:
+    """Test ModelConfig class."""
+
+    def test_to_dict_is_plain_dict(self, config):
+        """Test that to_dict returns a JSON-serializable dict."""
+        result = config.to_dict()
+        assert type(result) is dict
+        assert result == {
+            "api_key": "sk-test",
+            "base_url": "https://example.com/v1",
+            "model_name": "qwen-plus",
+        }
+        assert json.loads(json.dumps(result)) == result
+        assert orjson.loads(orjson.dumps(result)) == result
+
+    def test_copy_and_pickle(self, config):
+        """Test that configs survive deepcopy, pickle and asdict."""
+        assert copy.deepcopy(config) == config
+        assert pickle.loads(pickle.dumps(config)) == config
+        assert dataclasses.asdict(config) == config.to_dict()
+
+    def test_hashable(self, config):
+        """Test that equal configs hash alike."""
+        assert hash(config) == hash(ModelConfig.from_dict(config.to_dict()))
+
+    def test_empty_model_name(self):
+        """Test that an empty model name is rejected."""
+        with pytest.raises(ValueError, match="model_name"):
+            ModelConfig(api_key="sk-test", model_name=" ")
+
+    def test_redacted_hides_api_key(self, config):
+        """Test that the logged form of a config never contains the key."""
+        assert _redacted(config)["api_key"] == "***"
+        assert "sk-test" not in str(_redacted(config))
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("true", True),
+        ("1", True),
+        (" Yes ", True),
+        ("false", False),
+        ("0", False),
+        ("", False),
+    ],
+)
+def test_env_flag(monkeypatch, value, expected):
+    """Test that only truthy strings enable a flag."""
+    monkeypatch.setenv("AGENT_UI_TEST_FLAG", value)
+    assert env_flag("AGENT_UI_TEST_FLAG") is expected
+
+
+def test_config_dump_passes_server_log_level():
+    """Test that the config dump is emitted under the server's logging setup."""
+    from src import server
+
+    messages = []
+    sink_id = logger.add(messages.append, level=server.LOG_LEVEL, format="{message}")
+    try:
+        log_model_configs()
+    finally:
+        logger.remove(sink_id)
+
+    dump = "".join(messages)
+    assert "Qwen Model Config" in dump
+    assert "'model_name': 'qwen-plus'" in dump
@@ -0,0 +1,62 @@
+"""
+Tests for the search agent's prompt-caching model wrapper.
+"""
+
+import pytest
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+
+from src.agents.search_agent.agent import PromptCachingOpenAIChat
+from src.config.model_config import QWEN_ROLE_MAP
+
+
+@pytest.fixture
+def models():
+    """A prompt-caching model and a stock model, both with the agent's role map."""
+    model = PromptCachingOpenAIChat(id="qwen3-max", api_key="test")
+    stock = OpenAIChat(id="qwen3-max", api_key="test")
+    model.default_role_map = stock.default_role_map = QWEN_ROLE_MAP
+    return model, stock
+
+
+class TestPromptCachingOpenAIChat:
+    """Test the wire format produced by PromptCachingOpenAIChat."""
+
+    def test_system_message_is_cache_marked(self, models):
+        """Test that the system prompt becomes one cache-marked text part."""
+        model, _ = models
+        message = model._format_message(
+            Message(role="system", content="You are a search assistant.")
+        )
+        assert message["role"] == "system"
+        assert message["content"] == [
+            {
+                "type": "text",
+                "text": "You are a search assistant.",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            Message(role="user", content="Latest AI news?"),
+            Message(role="assistant", content="Here is what I found."),
+            Message(
+                role="assistant",
+                tool_calls=[
+                    {
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "web_search", "arguments": "{}"},
+                    }
+                ],
+            ),
+            Message(role="tool", tool_call_id="call_1", content='{"results": []}'),
+        ],
+        ids=["user", "assistant", "assistant_tool_calls", "tool"],
+    )
+    def test_other_messages_are_unchanged(self, models, message):
+        """Test that non-system messages match the stock OpenAIChat format."""
+        model, stock = models
+        assert model._format_message(message) == stock._format_message(message)
@@ -0,0 +1,35 @@
+"""
+Tests for the server lifespan.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src import server
+
+
+async def _no_warmup():
+    pass
+
+
+async def _failing_aclose():
+    raise RuntimeError("close failed")
+
+
+def test_pool_is_shut_down_when_client_close_fails(monkeypatch):
+    """Test that the tool pool is shut down even if closing the client raises."""
+    monkeypatch.setattr(server, "warm_model_connection", _no_warmup)
+    monkeypatch.setattr(server.shared_http_client, "aclose", _failing_aclose)
+    app = SimpleNamespace(state=SimpleNamespace())
+
+    async def run():
+        with pytest.raises(RuntimeError, match="close failed"):
+            async with server.lifespan(app):
+                pass
+        # Checked before asyncio.run shuts down the loop's default executor
+        with pytest.raises(RuntimeError, match="shutdown"):
+            app.state.tool_pool.submit(print)
+
+    asyncio.run(run())
@@ -1,13 +1,17 @@
 from src.tools.tavily import tavily_tool
-import json
+import orjson
+import os
+import pytest
 import sys
 
+pytestmark = pytest.mark.live
+
 def test_tool():
     """
     测试tavily工具并正确显示中文内容。
     
     解决中文显示问题的几种方法：
-    1. 使用 json.dumps(ensure_ascii=False) 正确序列化
+    1. 使用 orjson 直接输出 UTF-8 字节
     2. 设置终端编码支持UTF-8
     3. 使用 pprint 美化输出
     """
@@ -15,28 +19,20 @@ def test_tool():
     query = "HiQLCD"
     response = tool.web_search_using_tavily(query,max_results=5)
     
-    # 如果返回的是字符串，先解析
-    if isinstance(response, str):
-        try:
-            response_dict = json.loads(response)
-        except json.JSONDecodeError:
-            response_dict = {"raw_response": response}
-    else:
-        response_dict = response
-    # 确保response_dict是字典类型
-    if not isinstance(response_dict, dict):
-        response_dict = {"response": response_dict}
+    # format="json" 时工具返回 JSON 字符串；解析失败应直接让测试失败
+    response_dict = orjson.loads(response) if type(response) is str else response
 
-        print("\n== 完整JSON输出 ===")
-    print(json.dumps(response_dict, ensure_ascii=False, indent=2))
+    print("\n== 完整JSON输出 ===")
+    # orjson keeps Chinese text as-is; decode so header and payload share print()
+    print(orjson.dumps(response_dict, option=orjson.OPT_INDENT_2).decode())
     
-    return response_dict
+    assert response_dict
 
 if __name__ == "__main__":
     # 确保终端支持UTF-8输出
     if sys.platform.startswith('win'):
         # Windows系统特殊处理
-        import os
         os.system('chcp 65001 >nul')
     
-    test_tool()
+    os.environ.setdefault("AGENT_UI_LIVE_TESTS", "1")
+    pytest.main([__file__, "-s"])
@@ -0,0 +1,57 @@
+"""
+Tests for the search agent's per-run tool concurrency hook.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from agno.run.base import RunContext
+
+from src.agents.search_agent import agent as search_agent_module
+
+
+def _max_concurrency(run_ids, monkeypatch, limit=1):
+    """Run one slow tool call per run id and return the peak overlap."""
+    monkeypatch.setattr(search_agent_module, "tool_concurrency_limit", limit)
+    active, peak = 0, 0
+    lock = threading.Lock()
+
+    def slow_tool():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return "done"
+
+    def call(run_id):
+        return search_agent_module.limit_tool_concurrency(
+            "slow_tool",
+            slow_tool,
+            {},
+            run_context=RunContext(run_id=run_id, session_id="s"),
+        )
+
+    with ThreadPoolExecutor(max_workers=len(run_ids)) as pool:
+        assert list(pool.map(call, run_ids)) == ["done"] * len(run_ids)
+    return peak
+
+
+class TestLimitToolConcurrency:
+    """Test that the tool concurrency limit applies per run."""
+
+    def test_calls_of_one_run_are_limited(self, monkeypatch):
+        """Test that calls of the same run wait for a free slot."""
+        assert _max_concurrency(["r1"] * 3, monkeypatch) == 1
+
+    def test_runs_do_not_block_each_other(self, monkeypatch):
+        """Test that calls of different runs execute concurrently."""
+        assert _max_concurrency(["r1", "r2", "r3"], monkeypatch) == 3
+
+    def test_slots_are_released(self, monkeypatch):
+        """Test that per-run semaphores are dropped once calls finish."""
+        _max_concurrency(["r1", "r1", "r2"], monkeypatch, limit=2)
+        assert search_agent_module._run_slots == {}
@@ -0,0 +1,54 @@
+"""
+Tests for the collect_user_feedback tool.
+"""
+
+import orjson
+import pytest
+
+from src.tools.user_control_flow.user_control_flow_tools import (
+    collect_user_feedback_tool,
+)
+
+collect_user_feedback = collect_user_feedback_tool.entrypoint
+
+TRICKY_TEXT = [
+    "What email address should I use?",
+    'Say "hi" to \\ the team',
+    "Line one\nLine two\ttabbed",
+    "Progress: 100% done, %s and %(name)s stay literal",
+    "收件人邮箱是什么？ ✉️",
+    "",
+]
+
+
+class TestCollectUserFeedback:
+    """Test the pre-rendered JSON responses of collect_user_feedback."""
+
+    @pytest.mark.parametrize("prompt", TRICKY_TEXT)
+    def test_awaiting_response(self, prompt):
+        """Test that the awaiting response equals orjson output of the full dict."""
+        expected = {
+            "status": "awaiting_input",
+            "prompt": prompt,
+            "message": "Pausing execution to collect user feedback",
+        }
+        result = collect_user_feedback(prompt=prompt)
+        assert result == orjson.dumps(expected).decode()
+        assert orjson.loads(result) == expected
+
+    @pytest.mark.parametrize("feedback", TRICKY_TEXT)
+    def test_completed_response(self, feedback):
+        """Test that the completed response equals orjson output of the full dict."""
+        expected = {
+            "status": "completed",
+            "feedback": feedback,
+            "message": f"User provided feedback: {feedback}",
+        }
+        result = collect_user_feedback(prompt="Any prompt?", feedback=feedback)
+        assert result == orjson.dumps(expected).decode()
+        assert orjson.loads(result) == expected
+
+    def test_repeated_prompt_is_stable(self):
+        """Test that a cached response is identical on repeated calls."""
+        first = collect_user_feedback(prompt='Retry "this"?')
+        assert collect_user_feedback(prompt='Retry "this"?') == first